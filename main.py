@@ -6,18 +6,88 @@ Solucionador Educativo de Series de Fourier
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
 import sys
 import os
+import ast
+import math
+import operator
+import multiprocessing
+import time
+from functools import lru_cache
 
 # Agregar el directorio actual al path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from modules.solver import FourierSolver
-from modules.explanations import FourierExplanation
-from modules.visualization import FourierVisualizer
+# Nota: matplotlib y los módulos de cálculo (SymPy) se importan de forma
+# diferida en los métodos que los usan, para que la ventana aparezca antes.
+
+
+def _float_pow(base, exponent) -> float:
+    """Potencia en coma flotante: acotada (desborda con OverflowError en lugar
+    de construir enteros gigantes como 10**10**10)"""
+    return float(base) ** float(exponent)
+
+
+# Operadores y constantes permitidos en el campo de período
+_PERIOD_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: _float_pow,
+    ast.Mod: operator.mod,
+}
+_PERIOD_UNARYOPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_PERIOD_NAMES = {
+    'pi': math.pi,
+    'e': math.e,
+    'tau': math.tau,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_period(text: str) -> float:
+    """
+    Evalúa de forma segura una expresión numérica para el período (ej: "2*pi")
+    
+    Solo acepta números (no True/False), + - * / ** %, signos y las
+    constantes pi, e y tau (también como np.pi / math.pi). Las potencias se
+    calculan en coma flotante para que un exponente enorme desborde en lugar
+    de colgar la interfaz. El resultado se memoriza por texto.
+    
+    Raises:
+        ValueError: Si la expresión no es válida
+    """
+    def _eval(node):
+        if isinstance(node, ast.Expression):
+            return _eval(node.body)
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return node.value
+        if isinstance(node, ast.BinOp) and type(node.op) in _PERIOD_BINOPS:
+            return _PERIOD_BINOPS[type(node.op)](_eval(node.left), _eval(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _PERIOD_UNARYOPS:
+            return _PERIOD_UNARYOPS[type(node.op)](_eval(node.operand))
+        if isinstance(node, ast.Name) and node.id in _PERIOD_NAMES:
+            return _PERIOD_NAMES[node.id]
+        if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id in ('np', 'math') and node.attr in _PERIOD_NAMES):
+            return _PERIOD_NAMES[node.attr]
+        raise ValueError(f"Expresión de período no permitida: {text!r}")
+    
+    try:
+        tree = ast.parse(text.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError(f"Expresión de período inválida: {text!r}")
+    
+    try:
+        value = float(_eval(tree))
+    except (ArithmeticError, TypeError):
+        # Desbordamiento, división por cero o potencia compleja ((-8)**(1/3))
+        raise ValueError(f"Expresión de período no válida: {text!r}")
+    return value
 
 
 class FourierApp:
@@ -33,6 +103,10 @@ class FourierApp:
         self.explainer = None
         self.visualizer = None  # Reemplaza animator
         self.current_animation = None
+        self._FourierEpicycles = None  # Clase importada en el primer uso
+        self._expl_cache = {}  # (función, período, N, tipo) → texto generado
+        self._last_flush = 0.0  # Último update_idletasks de la barra de estado
+        self._flush_pending = None  # after() del vaciado final pendiente
         
         # Funciones de ejemplo con nombres descriptivos - 21 FUNCIONES CLÁSICAS
         # Formato: "Nombre Descriptivo | código"
@@ -70,6 +144,12 @@ class FourierApp:
             "Valor absoluto |x| | abs(x)",
         ]
         
+        # Separar "Nombre | código" una sola vez: entrada del menú -> código
+        self._example_map = {
+            entry: entry.split(" | ", 1)[1] if " | " in entry else entry
+            for entry in self.example_functions
+        }
+        
         # Tema
         self.theme = "light"
         self.colors = {
@@ -129,14 +209,15 @@ class FourierApp:
         row2.pack(fill=tk.X, pady=5)
         
         ttk.Label(row2, text="Período (T):").pack(side=tk.LEFT, padx=5)
-        self.period_entry = ttk.Entry(row2, width=15)
+        self.period_var = tk.StringVar(value=str(2*np.pi))
+        self.period_entry = ttk.Entry(row2, width=15, textvariable=self.period_var)
         self.period_entry.pack(side=tk.LEFT, padx=5)
-        self.period_entry.insert(0, str(2*np.pi))
         
         ttk.Label(row2, text="Número de términos (N):").pack(side=tk.LEFT, padx=(20, 5))
-        self.nterms_spinbox = ttk.Spinbox(row2, from_=1, to=1000, width=10)
+        self.nterms_var = tk.IntVar(value=10)
+        self.nterms_spinbox = ttk.Spinbox(row2, from_=1, to=1000, width=10,
+                                          textvariable=self.nterms_var)
         self.nterms_spinbox.pack(side=tk.LEFT, padx=5)
-        self.nterms_spinbox.set(10)
         
         # Fila 3: Velocidad de animación (para epiciclos)
         row3 = ttk.Frame(input_frame)
@@ -211,9 +292,18 @@ class FourierApp:
         # Configurar el scroll region cuando el frame cambie de tamaño
         self.canvas_frame.bind('<Configure>', self.on_canvas_configure)
         
-        # Habilitar scroll con la rueda del mouse
-        self.viz_canvas.bind_all("<MouseWheel>", self.on_mousewheel)
-        self.viz_canvas.bind_all("<Shift-MouseWheel>", self.on_shift_mousewheel)
+        # Figura y canvas persistentes: cada vista solo redibuja su contenido
+        # (se crean en el primer gráfico, ver _ensure_canvas)
+        self._fig = None
+        self._canvas = None
+        self._toolbar = None
+        self._view_widgets = []  # Controles propios de la vista actual (ej. zoom)
+        self._view_cids = []  # Callbacks conectados al canvas durante la vista actual
+        
+        # Habilitar scroll con la rueda del mouse solo mientras el puntero
+        # está sobre la visualización (la tabla y el texto usan su scroll nativo)
+        self.viz_canvas.bind("<Enter>", self._bind_mousewheel)
+        self.viz_canvas.bind("<Leave>", self._unbind_mousewheel)
         
         # Pestaña 2: Explicación Educativa
         self.edu_frame = ttk.Frame(self.notebook)
@@ -276,6 +366,16 @@ class FourierApp:
         """Actualiza el scroll region cuando el canvas cambia de tamaño"""
         self.viz_canvas.configure(scrollregion=self.viz_canvas.bbox("all"))
     
+    def _bind_mousewheel(self, event=None):
+        """Activa el scroll con rueda al entrar en la visualización"""
+        self.viz_canvas.bind_all("<MouseWheel>", self.on_mousewheel)
+        self.viz_canvas.bind_all("<Shift-MouseWheel>", self.on_shift_mousewheel)
+    
+    def _unbind_mousewheel(self, event=None):
+        """Desactiva el scroll con rueda al salir de la visualización"""
+        self.viz_canvas.unbind_all("<MouseWheel>")
+        self.viz_canvas.unbind_all("<Shift-MouseWheel>")
+    
     def on_mousewheel(self, event):
         """Scroll vertical con la rueda del mouse"""
         self.viz_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -288,24 +388,44 @@ class FourierApp:
         """Carga una función de ejemplo del menú desplegable"""
         selected = self.example_combo.get()
         if selected:
-            # Extraer el código después del separador "|"
-            if " | " in selected:
-                # Formato: "Nombre descriptivo | código"
-                _, code = selected.split(" | ", 1)
-            else:
-                # Formato antiguo (retrocompatibilidad)
-                code = selected
+            # Código precalculado en __init__ (formato antiguo: la entrada es el código)
+            code = self._example_map.get(selected, selected)
             
             self.function_entry.delete(0, tk.END)
             self.function_entry.insert(0, code)
     
     def update_status(self, message):
-        """Actualiza la barra de estado"""
+        """
+        Actualiza la barra de estado
+        
+        El texto se cambia siempre, pero el vaciado de la cola de Tk
+        (update_idletasks) se limita a uno cada 50 ms: en secuencias como
+        calcular + graficar los mensajes intermedios no fuerzan un relayout
+        cada uno. Los mensajes dentro de esa ventana dejan programado un
+        único vaciado final, así el último estado siempre se muestra.
+        """
         self.status_bar.config(text=message)
+        elapsed = time.monotonic() - self._last_flush
+        if elapsed > 0.05:
+            self._flush_status()
+        elif self._flush_pending is None:
+            delay = max(1, int((0.05 - elapsed) * 1000))
+            self._flush_pending = self.root.after(delay, self._flush_status)
+    
+    def _flush_status(self):
+        """Vacía la cola de Tk para pintar la barra de estado"""
+        if self._flush_pending is not None:
+            self.root.after_cancel(self._flush_pending)
+            self._flush_pending = None
+        self._last_flush = time.monotonic()
         self.root.update_idletasks()
     
     def calculate(self):
         """Calcula la serie de Fourier"""
+        from modules.solver import FourierSolver
+        from modules.explanations import FourierExplanation
+        from modules.visualization import FourierVisualizer
+        
         try:
             self.update_status("Calculando...")
             
@@ -315,10 +435,11 @@ class FourierApp:
                 messagebox.showerror("Error", "Por favor ingrese una función")
                 return
             
-            period = float(eval(self.period_entry.get()))
-            n_terms = int(self.nterms_spinbox.get())
+            period = _parse_period(self.period_var.get())
+            n_terms = self.nterms_var.get()
             
             # Crear solver
+            self._expl_cache.clear()
             self.solver = FourierSolver(function_str, period, n_terms)
             
             # Calcular coeficientes
@@ -341,22 +462,88 @@ class FourierApp:
             messagebox.showerror("Error", f"Error al calcular: {str(e)}")
             self.update_status("Error en el cálculo")
     
+    def _ensure_canvas(self):
+        """Crea la figura, el canvas y el toolbar persistentes la primera vez"""
+        if self._canvas is not None:
+            return
+        
+        # Import diferido: matplotlib solo se carga al mostrar el primer gráfico
+        # El backend se fija aquí, una sola vez, para toda la aplicación Tk
+        import matplotlib
+        matplotlib.use('TkAgg')
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+        
+        self._fig = Figure(figsize=(12, 8), layout=None)
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.canvas_frame)
+        self._toolbar = NavigationToolbar2Tk(self._canvas, self.canvas_frame,
+                                             pack_toolbar=False)
+        
+        # Registrar los ids de todo lo que se conecte al canvas a partir de
+        # ahora (p. ej. los eventos de una animación) para desconectarlos al
+        # cambiar de vista sin tocar los internos de FuncAnimation
+        connect = self._canvas.mpl_connect
+        
+        def mpl_connect(event_name, func):
+            cid = connect(event_name, func)
+            self._view_cids.append(cid)
+            return cid
+        
+        self._canvas.mpl_connect = mpl_connect
+    
+    def _prepare_canvas(self):
+        """Deja el canvas persistente listo para una nueva vista"""
+        self._ensure_canvas()
+        
+        # Detener animación anterior: su timer y sus callbacks seguirían
+        # dibujando sobre la figura persistente
+        anim = self.current_animation
+        if anim is not None:
+            if anim.event_source is not None:
+                anim.pause()
+            self.current_animation = None
+        for cid in self._view_cids:
+            self._canvas.mpl_disconnect(cid)
+        self._view_cids.clear()
+        
+        # Eliminar solo los controles de la vista anterior (canvas y toolbar se conservan)
+        for widget in self._view_widgets:
+            widget.destroy()
+        self._view_widgets.clear()
+        
+        self._fig.clf()
+    
+    def _show_canvas(self):
+        """Ajusta el canvas al tamaño de la figura actual y la redibuja"""
+        width, height = self._fig.bbox.size
+        canvas_widget = self._canvas.get_tk_widget()
+        canvas_widget.configure(width=int(width), height=int(height))
+        if not canvas_widget.winfo_manager():
+            canvas_widget.pack(fill=tk.BOTH, expand=True)
+            self._toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Los ejes son nuevos: reiniciar el historial de navegación del toolbar
+        self._toolbar.update()
+        self._canvas.draw_idle()
+    
     def update_coefficients_table(self):
         """Actualiza la tabla de coeficientes"""
-        # Limpiar tabla
-        for item in self.coeff_tree.get_children():
-            self.coeff_tree.delete(item)
-        
-        # Agregar a₀
-        self.coeff_tree.insert('', 'end', values=(0, f"{self.solver.a0:.8f}", "0.00000000", 
-                                                  f"{abs(self.solver.a0):.8f}"))
+        # Limpiar tabla (una sola llamada a Tk)
+        self.coeff_tree.delete(*self.coeff_tree.get_children())
+        
+        # Preconstruir todas las filas antes de tocar el widget
+        # (arrays y magnitudes ya calculados por el solver)
+        rows = [(0, f"{self.solver.a0:.8f}", "0.00000000", f"{abs(self.solver.a0):.8f}")]
+        rows.extend(
+            (i, f"{an:.8f}", f"{bn:.8f}", f"{magnitude:.8f}")
+            for i, (an, bn, magnitude) in enumerate(
+                zip(self.solver.an_arr, self.solver.bn_arr, self.solver.mag_arr), 1)
+        )
         
-        # Agregar términos
-        for i, (an, bn) in enumerate(zip(self.solver.an_list, self.solver.bn_list), 1):
-            magnitude = np.sqrt(an**2 + bn**2)
-            self.coeff_tree.insert('', 'end', values=(
-                i, f"{an:.8f}", f"{bn:.8f}", f"{magnitude:.8f}"
-            ))
+        # Insertar filas (Tk difiere el redibujado hasta que el bucle termina)
+        insert = self.coeff_tree.insert
+        for row in rows:
+            insert('', 'end', values=row)
     
     def show_static_plot(self):
         """Muestra el gráfico estático"""
@@ -367,21 +554,12 @@ class FourierApp:
         try:
             self.update_status("Generando gráfico...")
             
-            # Limpiar canvas anterior
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
-            
-            # Crear gráfico
-            fig = self.visualizer.create_static_plot(show_error=True)
+            # Limpiar vista anterior
+            self._prepare_canvas()
             
-            # Integrar con Tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Agregar toolbar
-            toolbar = NavigationToolbar2Tk(canvas, self.canvas_frame)
-            toolbar.update()
+            # Crear gráfico sobre la figura persistente
+            self.visualizer.create_static_plot(show_error=True, fig=self._fig)
+            self._show_canvas()
             
             self.notebook.select(self.viz_frame)
             self.update_status("Gráfico mostrado")
@@ -398,33 +576,36 @@ class FourierApp:
         try:
             self.update_status("Generando epiciclos...")
             
-            # Limpiar canvas anterior
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
+            # Limpiar vista anterior
+            self._prepare_canvas()
             
             # Crear animación de epiciclos con preset de velocidad
-            from modules.epicycles import FourierEpicycles
-            epicycles = FourierEpicycles(self.solver)
+            if self._FourierEpicycles is None:
+                from modules.epicycles import FourierEpicycles
+                self._FourierEpicycles = FourierEpicycles
+            epicycles = self._FourierEpicycles(self.solver)
             
             # Obtener preset de velocidad del GUI
             speed_preset = self.speed_var.get()
             
             # Usar todos los términos disponibles con preset de velocidad
+            # blit=True: cada frame solo redibuja círculos, radios y trazo
             fig, anim = epicycles.create_epicycles_animation(
                 n_terms=self.solver.n_terms,
-                speed_preset=speed_preset
+                speed_preset=speed_preset,
+                blit=True,
+                fig=self._fig
             )
             self.current_animation = anim  # Guardar referencia
             
-            # Integrar con Tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas_widget = canvas.get_tk_widget()
-            canvas_widget.pack(fill=tk.BOTH, expand=True)
+            # Mostrar en el canvas persistente
+            canvas = self._canvas
+            self._show_canvas()
             
             # Frame para controles de zoom
             zoom_frame = ttk.Frame(self.canvas_frame)
-            zoom_frame.pack(fill=tk.X, pady=5)
+            zoom_frame.pack(fill=tk.X, pady=5, before=self._toolbar)
+            self._view_widgets.append(zoom_frame)
             
             # Botones de zoom
             ttk.Button(zoom_frame, text="🔍+ Acercar", 
@@ -436,12 +617,8 @@ class FourierApp:
             
             # Guardar límites originales para reset
             ax = fig.axes[0]
-            self.original_xlim = ax.get_xlim()
-            self.original_ylim = ax.get_ylim()
-            
-            # Agregar toolbar
-            toolbar = NavigationToolbar2Tk(canvas, self.canvas_frame)
-            toolbar.update()
+            self.original_xlim = np.array(ax.get_xlim())
+            self.original_ylim = np.array(ax.get_ylim())
             
             self.notebook.select(self.viz_frame)
             self.update_status("Epiciclos en reproducción - Círculos de Fourier")
@@ -458,22 +635,12 @@ class FourierApp:
         try:
             self.update_status("Generando espectro...")
             
-            # Limpiar canvas anterior
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
-            
-            # Crear gráfico
-            # Crear gráfico de espectro
-            fig = self.visualizer.create_spectrum_plot()
-            
-            # Integrar con Tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Limpiar vista anterior
+            self._prepare_canvas()
             
-            # Agregar toolbar
-            toolbar = NavigationToolbar2Tk(canvas, self.canvas_frame)
-            toolbar.update()
+            # Crear gráfico de espectro sobre la figura persistente
+            self.visualizer.create_spectrum_plot(fig=self._fig)
+            self._show_canvas()
             
             self.notebook.select(self.viz_frame)
             self.update_status("Espectro mostrado")
@@ -490,22 +657,12 @@ class FourierApp:
         try:
             self.update_status("Generando gráfico de términos...")
             
-            # Limpiar canvas anterior
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
+            # Limpiar vista anterior
+            self._prepare_canvas()
             
-            # Crear gráfico
-            # Crear gráfico término por término
-            fig = self.visualizer.create_term_by_term_plot(max_terms=6)
-            
-            # Integrar con Tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Agregar toolbar
-            toolbar = NavigationToolbar2Tk(canvas, self.canvas_frame)
-            toolbar.update()
+            # Crear gráfico término por término sobre la figura persistente
+            self.visualizer.create_term_by_term_plot(max_terms=6, fig=self._fig)
+            self._show_canvas()
             
             self.notebook.select(self.viz_frame)
             self.update_status("Términos mostrados")
@@ -513,16 +670,49 @@ class FourierApp:
         except Exception as e:
             messagebox.showerror("Error", f"Error al mostrar términos: {str(e)}")
     
+    def _set_explanation_text(self, text):
+        """
+        Reemplaza el contenido del área de explicaciones
+        
+        Args:
+            text: Texto completo a mostrar
+        """
+        # Una sola llamada Tcl (replace) en lugar de delete + insert
+        self.explanation_text.configure(state='normal')
+        self.explanation_text.replace('1.0', tk.END, text)
+        self.explanation_text.yview_moveto(0)
+    
+    def _cached_explanation(self, kind, build):
+        """
+        Devuelve una explicación generada, reutilizándola si ya existe
+        
+        Args:
+            kind: Tipo de explicación ('theory', 'a0', 'summary', ...)
+            build: Función sin argumentos que genera el texto
+            
+        Returns:
+            Texto de la explicación
+        """
+        solver = self.explainer.solver
+        key = (solver.function_str, solver.period, solver.n_terms, kind)
+        text = self._expl_cache.get(key)
+        if text is None:
+            text = build()
+            self._expl_cache[key] = text
+        return text
+    
     def show_theory(self):
         """Muestra la teoría básica"""
         if self.explainer is None:
+            from modules.solver import FourierSolver
+            from modules.explanations import FourierExplanation
+            
             # Crear explicador genérico
             dummy_solver = FourierSolver("sin(x)", 2*np.pi, 5)
             self.explainer = FourierExplanation(dummy_solver)
         
-        theory = self.explainer.explain_theory()
-        self.explanation_text.delete('1.0', tk.END)
-        self.explanation_text.insert('1.0', theory)
+        theory = self._cached_explanation('theory', self.explainer.explain_theory)
+        self._set_explanation_text(theory)
         self.notebook.select(self.edu_frame)
         self.update_status("Teoría mostrada")
     
@@ -532,9 +722,8 @@ class FourierApp:
             messagebox.showwarning("Advertencia", "Primero debe calcular la serie")
             return
         
-        explanation = self.explainer.explain_a0_calculation()
-        self.explanation_text.delete('1.0', tk.END)
-        self.explanation_text.insert('1.0', explanation)
+        explanation = self._cached_explanation('a0', self.explainer.explain_a0_calculation)
+        self._set_explanation_text(explanation)
         self.notebook.select(self.edu_frame)
         self.update_status("Explicación de a₀ mostrada")
     
@@ -544,16 +733,18 @@ class FourierApp:
             messagebox.showwarning("Advertencia", "Primero debe calcular la serie")
             return
         
-        explanation = ""
-        # Mostrar los primeros 3 términos
-        for n in range(1, min(4, len(self.solver.an_list) + 1)):
-            explanation += self.explainer.explain_an_calculation(n) + "\n"
-            explanation += self.explainer.explain_bn_calculation(n) + "\n"
-        
-        explanation += self.explainer.explain_symbolic_formulas()
+        def build():
+            explanation = ""
+            # Mostrar los primeros 3 términos
+            for n in range(1, min(4, len(self.solver.an_list) + 1)):
+                explanation += self.explainer.explain_an_calculation(n) + "\n"
+                explanation += self.explainer.explain_bn_calculation(n) + "\n"
+            
+            explanation += self.explainer.explain_symbolic_formulas()
+            return explanation
         
-        self.explanation_text.delete('1.0', tk.END)
-        self.explanation_text.insert('1.0', explanation)
+        explanation = self._cached_explanation('coefficients', build)
+        self._set_explanation_text(explanation)
         self.notebook.select(self.edu_frame)
         self.update_status("Explicación de coeficientes mostrada")
     
@@ -563,11 +754,13 @@ class FourierApp:
             messagebox.showwarning("Advertencia", "Primero debe calcular la serie")
             return
         
-        summary = self.explainer.get_coefficients_summary()
-        summary += "\n" + self.explainer.get_series_construction()
+        summary = self._cached_explanation(
+            'summary',
+            lambda: (self.explainer.get_coefficients_summary() + "\n" +
+                     self.explainer.get_series_construction())
+        )
         
-        self.explanation_text.delete('1.0', tk.END)
-        self.explanation_text.insert('1.0', summary)
+        self._set_explanation_text(summary)
         self.notebook.select(self.edu_frame)
         self.update_status("Resumen mostrado")
     
@@ -578,9 +771,8 @@ class FourierApp:
             return
         
         self.update_status("Generando explicación completa...")
-        explanation = self.explainer.get_complete_explanation()
-        self.explanation_text.delete('1.0', tk.END)
-        self.explanation_text.insert('1.0', explanation)
+        explanation = self._cached_explanation('complete', self.explainer.get_complete_explanation)
+        self._set_explanation_text(explanation)
         self.notebook.select(self.edu_frame)
         self.update_status("Explicación completa mostrada")
     
@@ -596,17 +788,17 @@ class FourierApp:
                 defaultextension=".txt",
                 filetypes=[("Archivo de texto", "*.txt"), 
                           ("CSV", "*.csv"),
+                          ("NumPy comprimido", "*.npz"),
                           ("Todos los archivos", "*.*")]
             )
             
             if not filename:
                 return
             
-            # Determinar formato
-            if filename.endswith('.csv'):
-                self.export_csv(filename)
-            else:
-                self.export_txt(filename)
+            # Determinar formato por extensión (texto por defecto)
+            ext = os.path.splitext(filename)[1].lower()
+            exporters = {'.csv': self.export_csv, '.npz': self.export_npz}
+            exporters.get(ext, self.export_txt)(filename)
             
             messagebox.showinfo("Éxito", f"Datos exportados a:\n{filename}")
             self.update_status(f"Datos exportados")
@@ -629,32 +821,44 @@ class FourierApp:
             f.write(f"{'n':>5} {'aₙ':>20} {'bₙ':>20} {'|cₙ|':>20}\n")
             f.write("-" * 60 + "\n")
             
-            for i, (an, bn) in enumerate(zip(self.solver.an_list, self.solver.bn_list), 1):
-                magnitude = np.sqrt(an**2 + bn**2)
-                f.write(f"{i:>5} {an:>20.10f} {bn:>20.10f} {magnitude:>20.10f}\n")
+            ns = np.arange(1, len(self.solver.an_arr) + 1)
+            
+            # Tabla completa en una sola llamada
+            np.savetxt(f, np.column_stack([ns, self.solver.an_arr, self.solver.bn_arr,
+                                           self.solver.mag_arr]),
+                       fmt='%5d %20.10f %20.10f %20.10f')
             
             f.write("\n" + "=" * 60 + "\n")
             f.write(f"Expresión de la serie:\n{self.solver.get_series_expression()}\n")
     
     def export_csv(self, filename):
         """Exporta a archivo CSV"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write("n,an,bn,magnitude\n")
-            f.write(f"0,{self.solver.a0},0.0,{abs(self.solver.a0)}\n")
-            
-            for i, (an, bn) in enumerate(zip(self.solver.an_list, self.solver.bn_list), 1):
-                magnitude = np.sqrt(an**2 + bn**2)
-                f.write(f"{i},{an},{bn},{magnitude}\n")
+        # Fila n=0 con a₀ seguida de todos los términos
+        an_arr = np.r_[self.solver.a0, self.solver.an_arr]
+        bn_arr = np.r_[0.0, self.solver.bn_arr]
+        mag_arr = np.r_[abs(self.solver.a0), self.solver.mag_arr]
+        ns = np.arange(len(an_arr))
+        
+        np.savetxt(filename, np.column_stack([ns, an_arr, bn_arr, mag_arr]),
+                   delimiter=',', fmt=['%d', '%.10f', '%.10f', '%.10f'],
+                   header='n,an,bn,magnitude', comments='', encoding='utf-8')
+    
+    def export_npz(self, filename):
+        """Exporta a archivo binario NumPy comprimido (sin formateo de texto)"""
+        np.savez_compressed(filename, a0=self.solver.a0, an=self.solver.an_arr,
+                            bn=self.solver.bn_arr, mag=self.solver.mag_arr)
     
     def clear_all(self):
         """Limpia todos los datos"""
-        # Limpiar canvas
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
+        # Limpiar canvas (se conserva el widget persistente, oculto)
+        if self._canvas is not None:
+            self._prepare_canvas()
+            self._canvas.draw_idle()
+            self._canvas.get_tk_widget().pack_forget()
+            self._toolbar.pack_forget()
         
-        # Limpiar tabla
-        for item in self.coeff_tree.get_children():
-            self.coeff_tree.delete(item)
+        # Limpiar tabla (una sola llamada a Tk)
+        self.coeff_tree.delete(*self.coeff_tree.get_children())
         
         # Limpiar explicación
         self.explanation_text.delete('1.0', tk.END)
@@ -662,8 +866,8 @@ class FourierApp:
         # Resetear objetos
         self.solver = None
         self.explainer = None
+        self._expl_cache.clear()
         self.visualizer = None
-        self.current_animation = None
         
         self.update_status("Datos limpiados")
     
@@ -678,24 +882,18 @@ class FourierApp:
         """
         ax = fig.axes[0]
         
-        # Obtener límites actuales
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-        
-        # Calcular centros
-        x_center = (xlim[0] + xlim[1]) / 2
-        y_center = (ylim[0] + ylim[1]) / 2
-        
-        # Calcular nuevos rangos
-        x_range = (xlim[1] - xlim[0]) * factor / 2
-        y_range = (ylim[1] - ylim[0]) * factor / 2
+        # Límites actuales como arrays [min, max]
+        xlim = np.array(ax.get_xlim())
+        ylim = np.array(ax.get_ylim())
         
-        # Aplicar nuevos límites
-        ax.set_xlim(x_center - x_range, x_center + x_range)
-        ax.set_ylim(y_center - y_range, y_center + y_range)
+        # Escalar alrededor del centro: centro + (lim - centro) * factor
+        x_center = xlim.mean()
+        y_center = ylim.mean()
+        ax.set_xlim(*(x_center + (xlim - x_center) * factor))
+        ax.set_ylim(*(y_center + (ylim - y_center) * factor))
         
-        # Redibujar
-        canvas.draw()
+        # Redibujar en el próximo ciclo ocioso (clics rápidos se agrupan)
+        canvas.draw_idle()
         self.update_status(f"Zoom aplicado: {100/factor:.0f}%")
     
     def reset_zoom(self, fig, canvas):
@@ -710,7 +908,7 @@ class FourierApp:
             ax = fig.axes[0]
             ax.set_xlim(self.original_xlim)
             ax.set_ylim(self.original_ylim)
-            canvas.draw()
+            canvas.draw_idle()
             self.update_status("Vista restablecida")
         else:
             messagebox.showwarning("Advertencia", "No hay vista original guardada")
@@ -724,4 +922,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Necesario para los procesos del solver en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     main()
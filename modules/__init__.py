@@ -1,12 +1,31 @@
 """
 Paquete modules - Solucionador Educativo de Series de Fourier
 Contiene los módulos principales de la aplicación
+
+Las clases se cargan bajo demanda (PEP 562): importar un submódulo, por
+ejemplo modules.solver, no arrastra matplotlib ni el resto del paquete.
 """
 
-from .solver import FourierSolver
-from .explanations import FourierExplanation
-from .visualization import FourierVisualizer
-from .epicycles import FourierEpicycles
+import importlib
+
+_LAZY_EXPORTS = {
+    'FourierSolver': '.solver',
+    'FourierExplanation': '.explanations',
+    'FourierVisualizer': '.visualization',
+    'FourierEpicycles': '.epicycles',
+}
 
 __all__ = ['FourierSolver', 'FourierExplanation', 'FourierVisualizer', 'FourierEpicycles']
 
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
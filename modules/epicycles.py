@@ -3,17 +3,132 @@ Módulo epicycles.py - Visualización de Círculos de Fourier (Epicíclos)
 Muestra cómo cada término de Fourier es un círculo rotando
 """
 
+import logging
 import numpy as np
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from matplotlib.patches import Circle
-import matplotlib
-matplotlib.use('TkAgg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.figure import Figure
+
+logger = logging.getLogger(__name__)
+
+# Numba es opcional: si está instalado, el cálculo por frame se compila
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# El backend lo elige la aplicación (main.py usa TkAgg); este módulo no lo fija
+
+
+def _harmonic_cos_sin(theta1, n_terms, block=16):
+    """
+    Calcula cos(nθ) y sin(nθ) para n = 1..n_terms por suma de ángulos
+    
+    Solo se evalúan directamente los múltiplos de block (anclas) y los
+    restos 0..block-1; el resto sale de cos(a+b) = cos a cos b - sin a sin b
+    y sin(a+b) = sin a cos b + cos a sin b. Como cada término parte de un ancla
+    calculada directamente, el error no se acumula con n.
+    
+    Args:
+        theta1: Array con el ángulo fundamental θ de cada fila
+        n_terms: Número de armónicos
+        block: Distancia entre anclas
+        
+    Returns:
+        Tupla (cos, sin) de forma (len(theta1), n_terms)
+    """
+    n = np.arange(1, n_terms + 1)
+    k, r = np.divmod(n, block)
+    
+    anchor = np.outer(theta1, np.arange(k[-1] + 1) * block)
+    rest = np.outer(theta1, np.arange(block))
+    cos_a, sin_a = np.cos(anchor)[:, k], np.sin(anchor)[:, k]
+    cos_r, sin_r = np.cos(rest)[:, r], np.sin(rest)[:, r]
+    
+    return cos_a * cos_r - sin_a * sin_r, sin_a * cos_r + cos_a * sin_r
+
+
+def _epicycle_frame_numpy(cos_row, sin_row, ang_row, r_v, visual_indices,
+                          hidden_idx, an_hidden, bn_hidden, x0, y0):
+    """
+    Calcula la geometría de un frame de epiciclos con operaciones de NumPy
+    
+    Con φₙ = atan2(aₙ, bₙ), la componente vertical de cada círculo es
+    rₙ·sin(nθ + φₙ) = aₙcos(nθ) + bₙsin(nθ): la altura de la punta es la serie.
+    
+    Args:
+        cos_row, sin_row: cos(nθ) y sin(nθ) del frame para todos los términos
+        ang_row: Ángulo nθ + φₙ del frame para todos los términos
+        r_v: Radios visuales de los círculos dibujados
+        visual_indices: Índices de los términos dibujados como círculos
+        hidden_idx: Índices de los términos no dibujados
+        an_hidden, bn_hidden: Coeficientes escalados de los términos no dibujados
+        x0, y0: Centro del primer círculo
+        
+    Returns:
+        Tupla (cx, cy, final_x, final_y) con los centros acumulados
+        (cx[j+1] es la punta del círculo j) y el punto final
+    """
+    ang_v = ang_row[visual_indices]
+    cx = np.cumsum(np.concatenate(([x0], r_v * np.cos(ang_v))))
+    cy = np.cumsum(np.concatenate(([y0], r_v * np.sin(ang_v))))
+    
+    # r·cos(θ+φ) = bn·cos θ - an·sin θ  y  r·sin(θ+φ) = an·cos θ + bn·sin θ
+    c_h = cos_row[hidden_idx]
+    s_h = sin_row[hidden_idx]
+    final_x = cx[-1] + bn_hidden @ c_h - an_hidden @ s_h
+    final_y = cy[-1] + an_hidden @ c_h + bn_hidden @ s_h
+    return cx, cy, final_x, final_y
+
+
+def _epicycle_frame_loops(cos_row, sin_row, ang_row, r_v, visual_indices,
+                          hidden_idx, an_hidden, bn_hidden, x0, y0):
+    """Versión con bucles de _epicycle_frame_numpy, pensada para compilarse con Numba"""
+    n_v = visual_indices.shape[0]
+    cx = np.empty(n_v + 1)
+    cy = np.empty(n_v + 1)
+    cx[0] = x0
+    cy[0] = y0
+    for j in range(n_v):
+        ang = ang_row[visual_indices[j]]
+        cx[j + 1] = cx[j] + r_v[j] * np.cos(ang)
+        cy[j + 1] = cy[j] + r_v[j] * np.sin(ang)
+    
+    final_x = cx[n_v]
+    final_y = cy[n_v]
+    for j in range(hidden_idx.shape[0]):
+        c = cos_row[hidden_idx[j]]
+        s = sin_row[hidden_idx[j]]
+        final_x += bn_hidden[j] * c - an_hidden[j] * s
+        final_y += an_hidden[j] * c + bn_hidden[j] * s
+    return cx, cy, final_x, final_y
+
+
+# Un único kernel por frame: compilado con Numba si está disponible
+if njit is not None:
+    _epicycle_frame = njit(cache=True, fastmath=True)(_epicycle_frame_loops)
+else:
+    _epicycle_frame = _epicycle_frame_numpy
+
+
+@lru_cache(maxsize=16)
+def _rainbow_colors(n_colors):
+    """Colores RGBA del arcoíris para n_colors círculos (cacheados, solo lectura)"""
+    colors = plt.cm.rainbow(np.linspace(0, 1, n_colors))
+    colors.flags.writeable = False
+    return colors
 
 
 class FourierEpicycles:
     """Clase para visualizar círculos de Fourier (epicíclos)"""
     
+    # Estilo del recuadro del texto informativo (compartido por todas las animaciones)
+    _INFO_BBOX = dict(boxstyle='round,pad=0.25', facecolor='white',
+                      edgecolor='#CCCCCC', alpha=0.85, linewidth=0.5)
+    
     def __init__(self, solver):
         """
         Inicializa el visualizador de epicíclos
@@ -23,30 +138,35 @@ class FourierEpicycles:
         """
         self.solver = solver
         
-    def create_epicycles_animation(self, n_terms=None, speed_preset='normal'):
+    def create_epicycles_animation(self, n_terms=None, speed_preset='normal', blit=True,
+                                   fig=None):
         """
         Crea una animación de círculos de Fourier - ULTRA OPTIMIZADO
         
         Args:
             n_terms: Número de términos a mostrar (None = usar todos disponibles)
             speed_preset: 'fast' (200 fps), 'normal' (120 fps), 'detailed' (80 fps), 'slow' (50 fps)
+            blit: Si True (por defecto), solo se redibujan los artistas animados en cada frame
+            fig: Figura a reutilizar (None = crear una nueva fuera de pantalla, con
+                 canvas Agg, para guardar la animación sin interfaz gráfica)
             
         Returns:
             Tupla (fig, animation)
         """
         # PRESETS DE VELOCIDAD - Dinámicos según cantidad de términos
+        # trail_points: resolución del trazo (más frames = trazo más fino)
         speed_configs = {
-            'fast': {'base_frames': 60, 'base_interval': 16},      # ~60 FPS, 1 segundo
-            'normal': {'base_frames': 100, 'base_interval': 25},   # ~40 FPS, 2.5 segundos
-            'detailed': {'base_frames': 150, 'base_interval': 40}, # ~25 FPS, 6 segundos
-            'slow': {'base_frames': 200, 'base_interval': 50}      # ~20 FPS, 10 segundos
+            'fast': {'base_frames': 60, 'base_interval': 16, 'trail_points': 60},       # ~60 FPS, 1 segundo
+            'normal': {'base_frames': 100, 'base_interval': 25, 'trail_points': 120},   # ~40 FPS, 2.5 segundos
+            'detailed': {'base_frames': 150, 'base_interval': 40, 'trail_points': 200}, # ~25 FPS, 6 segundos
+            'slow': {'base_frames': 200, 'base_interval': 50, 'trail_points': 300}      # ~20 FPS, 10 segundos
         }
         
         if n_terms is None:
             n_terms = self.solver.n_terms  # Usar TODOS los términos disponibles
         
         # Limitar a los coeficientes calculados
-        n_terms = min(n_terms, len(self.solver.an_list))
+        n_terms = min(n_terms, len(self.solver.an_arr))
         
         # NUEVO: Sistema inteligente de selección de círculos visibles
         # Para muchos términos, mostrar los más significativos (mayores amplitudes)
@@ -58,27 +178,36 @@ class FourierEpicycles:
             # Para 150+ términos, mostrar los 150 más grandes
             visual_terms = min(150, n_terms)
         
-        # OPTIMIZACIÓN: Precalcular arrays de coeficientes
-        an_array = np.array(self.solver.an_list[:n_terms])
-        bn_array = np.array(self.solver.bn_list[:n_terms])
-        radii = np.sqrt(an_array**2 + bn_array**2)
-        phases = np.arctan2(bn_array, an_array)
+        # OPTIMIZACIÓN: Coeficientes del solver en float32 (precisión de sobra para
+        # dibujar en pantalla y la mitad de memoria en las tablas por frame)
+        an_array = self.solver.an_arr[:n_terms].astype(np.float32)
+        bn_array = self.solver.bn_arr[:n_terms].astype(np.float32)
+        radii = self.solver.mag_arr[:n_terms].astype(np.float32)
+        # Fase tal que la altura de cada círculo sea aₙcos(nθ) + bₙsin(nθ)
+        phases = np.arctan2(an_array, bn_array)
         
         # Si hay muchos términos, seleccionar los más significativos para visualizar
         if n_terms > visual_terms:
             # Ordenar por magnitud y tomar los más grandes
             indices_sorted = np.argsort(radii)[::-1]  # De mayor a menor
-            visual_indices = sorted(indices_sorted[:visual_terms])  # Mantener orden original
+            visual_indices = np.sort(indices_sorted[:visual_terms])  # Mantener orden original
             
-            print(f"⚠️ Mostrando los {visual_terms} círculos más grandes de {n_terms} términos totales")
-            print(f"   Amplitud mínima mostrada: {radii[visual_indices[-1]]:.6f}")
+            logger.debug("Mostrando los %d círculos más grandes de %d términos totales "
+                         "(amplitud mínima mostrada: %.6f)",
+                         visual_terms, n_terms, radii[visual_indices].min())
         else:
-            visual_indices = list(range(n_terms))
+            visual_indices = np.arange(n_terms, dtype=np.intp)
         
         # CREAR FIGURA ADAPTABLE - Se ajusta al espacio disponible
         # El tamaño real lo determina el canvas de Tkinter, no matplotlib
         # Proporción compacta que se adapta bien a ventanas modernas
-        fig, ax = plt.subplots(1, 1, figsize=(10, 3.8))
+        if fig is None:
+            fig = Figure(figsize=(10, 3.8))
+            FigureCanvasAgg(fig)
+        else:
+            fig.clf()
+            fig.set_size_inches(10, 3.8)
+        ax = fig.subplots(1, 1)
         fig.patch.set_facecolor('#f8f9fa')
         
         # Reducir márgenes para aprovechar espacio
@@ -118,6 +247,7 @@ class FourierEpicycles:
         ax.set_xlim(-circle_space * view_expansion - left_margin, 
                     self.solver.L + right_margin)
         ax.set_ylim(y_min * 1.2, y_max * 1.2)  # También expandir verticalmente
+        ax.set_autoscale_on(False)  # Límites fijos: los artistas animados no recalculan ejes
         
         # Configurar panel - SIN aspect equal para aprovechar espacio
         ax.grid(True, alpha=0.2, linestyle='--', linewidth=0.5)
@@ -132,27 +262,24 @@ class FourierEpicycles:
         ax.plot(x_vals, y_original, color='#88AAFF', linewidth=1.5, 
                 alpha=0.3, linestyle=':', zorder=1)
         
-        # Elementos a animar
-        circles = []
-        lines = []
-        
         # Crear círculos y líneas con colores del arcoíris
-        colors = plt.cm.rainbow(np.linspace(0, 1, len(visual_indices)))
+        colors = _rainbow_colors(len(visual_indices))
         
-        # Crear círculos ULTRA DELGADOS - Estilo GIF con escala reducida
-        for idx, i in enumerate(visual_indices):
-            # Usar el radio VISUAL (escalado) para círculos más pequeños
-            radius_visual = radii_visual[i]
-            
-            # Círculo muy delgado y sutil
-            circle = Circle((0, 0), radius_visual, fill=False, 
-                          color=colors[idx], linewidth=1.2, alpha=0.5)
-            ax.add_patch(circle)
-            circles.append(circle)
-            
-            # Línea del radio ultra delgada
-            line, = ax.plot([], [], color=colors[idx], linewidth=1, alpha=0.4)
-            lines.append(line)
+        # Radios visuales de los círculos dibujados
+        r_v = radii_visual[visual_indices]
+        
+        # Círculos ULTRA DELGADOS en una sola colección (un único artista)
+        # Se usa el radio VISUAL (escalado) para círculos más pequeños
+        circles = EllipseCollection(2 * r_v, 2 * r_v, np.zeros(len(visual_indices)), units='xy',
+                                    offsets=np.zeros((len(visual_indices), 2)),
+                                    offset_transform=ax.transData,
+                                    facecolors='none', edgecolors=colors,
+                                    linewidths=1.2, alpha=0.5)
+        ax.add_collection(circles, autolim=False)
+        
+        # Líneas de los radios ultra delgadas, también en una sola colección
+        lines = LineCollection([], colors=colors, linewidths=1, alpha=0.4)
+        ax.add_collection(lines, autolim=False)
         
         # Punto final pequeño pero visible
         point, = ax.plot([], [], 'o', color='#FF3366', markersize=7, 
@@ -174,84 +301,105 @@ class FourierEpicycles:
         info_text = ax.text(0.98, 0.97, '', transform=ax.transAxes,
                             fontsize=7, verticalalignment='top', horizontalalignment='right',
                             fontweight='normal',
-                            bbox=dict(boxstyle='round,pad=0.25', facecolor='white',
-                                    edgecolor='#CCCCCC', alpha=0.85, linewidth=0.5))
+                            bbox=self._INFO_BBOX)
+        
+        # OPTIMIZACIÓN DINÁMICA: Ajustar frames e interval según preset y complejidad
+        config = speed_configs[speed_preset]
+        
+        # Ajustar según cantidad de términos (más términos = menos frames para mantener velocidad)
+        if n_terms <= 50:
+            n_frames = config['base_frames']
+            interval_adjusted = config['base_interval']
+        elif n_terms <= 200:
+            n_frames = int(config['base_frames'] * 0.75)  # 25% menos frames
+            interval_adjusted = config['base_interval']
+        else:  # 200+ términos
+            n_frames = int(config['base_frames'] * 0.5)  # 50% menos frames
+            interval_adjusted = config['base_interval']
+        
+        # PRECÁLCULO: tablas de ángulos por frame (n_frames × n_terms)
+        # update() solo indexa la fila del frame actual
+        # Los ángulos se calculan en float64 y las tablas se guardan en float32
+        omegas = np.arange(1, n_terms + 1) * np.pi / self.solver.L
+        x_positions = -self.solver.L + (np.arange(n_frames) / 100) * (2 * self.solver.L)
+        theta = np.outer(x_positions, omegas)
+        cos_theta, sin_theta = (t.astype(np.float32) for t in
+                                _harmonic_cos_sin(x_positions * (np.pi / self.solver.L), n_terms))
+        angles_table = (theta + phases).astype(np.float32)
+        
+        # TRAZO PRECALCULADO: la serie se evalúa una sola vez sobre todo el recorrido
+        # (hasta el x del último frame) y cada frame muestra solo un prefijo
+        x_end = x_positions[-1]
+        n_trail = int(config['trail_points'] * max(1.0, (x_end + self.solver.L) / (2 * self.solver.L)))
+        x_trail = np.linspace(-self.solver.L, x_end, n_trail)
+        # Base (n_trail × n_terms) de cos/sin: el trazo es un par de productos matriz-vector
+        cos_trail, sin_trail = (t.astype(np.float32) for t in
+                                _harmonic_cos_sin(x_trail * (np.pi / self.solver.L), n_terms))
+        y_trail = self.solver.a0 / 2 + cos_trail @ an_array + sin_trail @ bn_array
+        
+        # Términos no visualizados: índices y coeficientes escalados (una sola vez)
+        hidden_mask = np.ones(n_terms, dtype=bool)
+        hidden_mask[visual_indices] = False
+        hidden_idx = np.flatnonzero(hidden_mask)
+        an_hidden = an_array[hidden_idx] * scale_factor
+        bn_hidden = bn_array[hidden_idx] * scale_factor
+        
+        # CÍRCULOS: Posición adaptativa - MÁS A LA IZQUIERDA
+        # Para funciones simples (pocos círculos), posicionar más cerca del centro
+        if len(visual_indices) <= 3:
+            # Funciones simples: más cercanas al centro para mejor visibilidad
+            circle_start_x = -circle_space * 0.8
+        else:
+            # Funciones complejas: más a la izquierda (como antes)
+            circle_start_x = -circle_space * 1.3
+        circle_start_y = self.solver.a0 / 2
+        
+        # Con blit, los artistas animados quedan fuera del dibujo normal de la figura
+        # (ejes, cuadrícula y f(x) original se dibujan una vez como fondo)
+        animated_artists = [circles, lines, point, current_point, connector_line,
+                            trail_function, info_text]
+        for artist in animated_artists:
+            artist.set_animated(blit)
+        
+        # Buffers de un elemento reutilizados por los puntos en cada frame
+        point_x, point_y = np.empty(1), np.empty(1)
+        current_x, current_y = np.empty(1), np.empty(1)
+        
+        # Buffer (N+1, 2) de centros reutilizado: fila j = centro del círculo j, última = punta
+        centers = np.empty((len(visual_indices) + 1, 2))
         
         def init():
             point.set_data([], [])
             current_point.set_data([], [])
             connector_line.set_data([], [])
             trail_function.set_data([], [])
-            for line in lines:
-                line.set_data([], [])
-            return circles + lines + [point, current_point, connector_line, trail_function, info_text]
+            lines.set_segments([])
+            return animated_artists
         
         def update(frame):
             # x avanza de -L a L
-            x_pos = -self.solver.L + (frame / 100) * (2 * self.solver.L)
+            x_pos = x_positions[frame]
             
-            # OPTIMIZACIÓN: Usar arrays precalculados y vectorización
-            # Frecuencias angulares (precalculadas una sola vez fuera sería mejor)
-            n_indices = np.arange(1, n_terms + 1)
-            omegas = n_indices * np.pi / self.solver.L
+            # OPTIMIZACIÓN: Un solo kernel sobre las tablas precalculadas (una fila por frame)
+            # Apila los círculos en orden de visual_indices con radios VISUALES (escalados)
+            # y suma la contribución de los términos no mostrados
+            cx, cy, final_x, final_y = _epicycle_frame(
+                cos_theta[frame], sin_theta[frame], angles_table[frame],
+                r_v, visual_indices, hidden_idx, an_hidden, bn_hidden,
+                circle_start_x, circle_start_y)
             
-            # Calcular TODAS las contribuciones con vectorización
-            angles = omegas * x_pos + phases
-            contributions = an_array * np.cos(omegas * x_pos) + bn_array * np.sin(omegas * x_pos)
+            # Valor de la función: la altura de la punta es a₀/2 + escala·serie
+            y_func = circle_start_y + (final_y - circle_start_y) / scale_factor
             
-            # Valor de la función
-            y_func = self.solver.a0 / 2 + np.sum(contributions)
-            
-            # CÍRCULOS: Posición adaptativa - MÁS A LA IZQUIERDA
-            # Colocar círculos bien a la izquierda para aprovechar el espacio
-            # Para funciones simples (pocos círculos), posicionar más cerca del centro
-            if len(visual_indices) <= 3:
-                # Funciones simples: más cercanas al centro para mejor visibilidad
-                circle_start_x = -circle_space * 0.8
-            else:
-                # Funciones complejas: más a la izquierda (como antes)
-                circle_start_x = -circle_space * 1.3
+            # Todos los centros y radios en una sola actualización por colección
+            centers[:, 0] = cx
+            centers[:, 1] = cy
+            circles.set_offsets(centers[:-1])
+            lines.set_segments(np.stack((centers[:-1], centers[1:]), axis=1))
             
-            circle_x = circle_start_x
-            circle_y = self.solver.a0 / 2
-            
-            # IMPORTANTE: Apilar círculos en orden correcto usando visual_indices
-            # Usar radios VISUALES (escalados) para mantener tamaño reducido
-            for idx, i in enumerate(visual_indices):
-                # Centro del círculo en la posición actual acumulada
-                circles[idx].center = (circle_x, circle_y)
-                
-                # Ángulo de rotación de este término
-                angle_i = angles[i]
-                
-                # Vector del radio usando RADIO VISUAL (escalado)
-                dx = radii_visual[i] * np.cos(angle_i)
-                dy = radii_visual[i] * np.sin(angle_i)
-                
-                # Dibujar línea del radio
-                lines[idx].set_data([circle_x, circle_x + dx], [circle_y, circle_y + dy])
-                
-                # Actualizar posición para el siguiente círculo
-                circle_y += dy
-                circle_x += dx
-            
-            # Punto final en los círculos (tip del último círculo visualizado)
-            final_x = circle_x
-            final_y = circle_y
-            
-            # Si hay términos no mostrados, agregar su contribución (con radios escalados)
-            if n_terms > len(visual_indices):
-                # Términos no visualizados pero que contribuyen al resultado
-                hidden_indices = [i for i in range(n_terms) if i not in visual_indices]
-                for i in hidden_indices:
-                    angle_i = angles[i]
-                    dx = radii_visual[i] * np.cos(angle_i)
-                    dy = radii_visual[i] * np.sin(angle_i)
-                    final_x += dx
-                    final_y += dy
-            
-            # Punto final (debe coincidir con y_func)
-            point.set_data([final_x], [final_y])
+            # Punto final (su altura es y_func con la escala visual de los círculos)
+            point_x[0], point_y[0] = final_x, final_y
+            point.set_data(point_x, point_y)
             
             # Línea conectora: desde el punto final de los círculos hasta el punto actual en la gráfica
             # Esta línea DEBE ir desde donde terminan los círculos hasta donde se está dibujando
@@ -259,19 +407,15 @@ class FourierEpicycles:
             
             # DIBUJAR LA FUNCIÓN: Solo la parte desde -L hasta x_pos (como en GIF)
             if frame > 0:
-                # Calcular puntos desde -L hasta posición actual
-                num_points = min(frame * 3, 300)
-                x_range = np.linspace(-self.solver.L, x_pos, num_points)
-                
-                # Evaluar serie
-                y_range = self.solver.evaluate_series(x_range, n_terms)
-                
-                trail_function.set_data(x_range, y_range)
+                # Prefijo del trazo precalculado desde -L hasta x_pos
+                k = int(np.searchsorted(x_trail, x_pos, side='right'))
+                trail_function.set_data(x_trail[:k], y_trail[:k])
             else:
                 trail_function.set_data([], [])
             
             # Punto actual en la función
-            current_point.set_data([x_pos], [y_func])
+            current_x[0], current_y[0] = x_pos, y_func
+            current_point.set_data(current_x, current_y)
             
             # Texto COMPACTO - Solo lo esencial
             if n_terms > len(visual_indices):
@@ -279,30 +423,17 @@ class FourierEpicycles:
             else:
                 info_text.set_text(f'N={n_terms}\nx={x_pos:.1f}\nf={y_func:.2f}')
             
-            return circles + lines + [point, current_point, connector_line, trail_function, info_text]
-        
-        # OPTIMIZACIÓN DINÁMICA: Ajustar frames e interval según preset y complejidad
-        config = speed_configs[speed_preset]
-        
-        # Ajustar según cantidad de términos (más términos = menos frames para mantener velocidad)
-        if n_terms <= 50:
-            n_frames = config['base_frames']
-            interval_adjusted = config['base_interval']
-        elif n_terms <= 200:
-            n_frames = int(config['base_frames'] * 0.75)  # 25% menos frames
-            interval_adjusted = config['base_interval']
-        else:  # 200+ términos
-            n_frames = int(config['base_frames'] * 0.5)  # 50% menos frames
-            interval_adjusted = config['base_interval']
+            return animated_artists
         
-        print(f"📊 Animación: {n_frames} frames, {interval_adjusted}ms/frame, preset={speed_preset}, términos={n_terms}")
+        logger.debug("Animación: %d frames, %dms/frame, preset=%s, términos=%d",
+                     n_frames, interval_adjusted, speed_preset, n_terms)
         
         anim = FuncAnimation(fig, update, init_func=init,
                            frames=n_frames, interval=interval_adjusted,
-                           blit=False, repeat=True)
+                           blit=blit, repeat=True)
         
         # Tight layout para aprovechar máximo el espacio disponible
-        plt.tight_layout(pad=0.5)
+        fig.tight_layout(pad=0.5)
         
         return fig, anim
     
@@ -310,6 +441,9 @@ class FourierEpicycles:
         """
         Crea un diagrama de fasores rotantes
         
+        Todos los fasores se dibujan desde el origen del plano complejo con una
+        sola llamada a quiver (un único artista, sin una subgráfica por término).
+        
         Args:
             n_terms: Número de términos
             
@@ -318,46 +452,46 @@ class FourierEpicycles:
         """
         if n_terms is None:
             n_terms = min(12, self.solver.n_terms)
+        n_terms = min(n_terms, len(self.solver.an_arr))
         
-        # Crear grid de subplots
-        n_cols = 4
-        n_rows = (n_terms + n_cols - 1) // n_cols
+        magnitude = self.solver.mag_arr[:n_terms]
+        phase = np.arctan2(self.solver.bn_arr[:n_terms], self.solver.an_arr[:n_terms])
+        ns = np.arange(1, n_terms + 1)
         
-        fig, axes = plt.subplots(n_rows, n_cols, figsize=(14, 3 * n_rows),
-                                subplot_kw=dict(projection='polar'))
+        fig, ax = plt.subplots(figsize=(8, 8))
         fig.patch.set_facecolor('#f8f9fa')
-        axes = axes.flatten() if n_terms > 1 else [axes]
         
-        for i in range(n_terms):
-            ax = axes[i]
-            n = i + 1
-            
-            an = self.solver.an_list[i]
-            bn = self.solver.bn_list[i]
-            
-            magnitude = np.sqrt(an**2 + bn**2)
-            phase = np.arctan2(bn, an)
-            
-            # Dibujar fasor
-            ax.arrow(0, 0, phase, magnitude, head_width=0.3, head_length=0.1,
-                    fc='#2E86AB', ec='#2E86AB', linewidth=2, alpha=0.8)
-            
-            ax.set_ylim(0, max(magnitude * 1.2, 0.1))
-            ax.set_title(f'n={n}\n|c|={magnitude:.3f}, φ={np.degrees(phase):.1f}°',
-                        fontsize=9, fontweight='bold')
-            ax.grid(True, alpha=0.3)
+        # Todos los fasores en una sola llamada, coloreados por n
+        origin = np.zeros(n_terms)
+        arrows = ax.quiver(origin, origin, magnitude * np.cos(phase), magnitude * np.sin(phase),
+                           ns, cmap='rainbow', angles='xy', scale_units='xy', scale=1,
+                           width=0.006, alpha=0.8)
+        
+        # Con pocos términos se rotula cada fasor; con muchos, barra de colores
+        if n_terms <= 12:
+            for n, r, phi in zip(ns, magnitude, phase):
+                ax.annotate(f'n={n}\n|c|={r:.3f}, φ={np.degrees(phi):.1f}°',
+                            (r * np.cos(phi), r * np.sin(phi)),
+                            fontsize=8, ha='center', va='bottom')
+        else:
+            fig.colorbar(arrows, ax=ax, label='n')
         
-        # Ocultar subplots no usados
-        for i in range(n_terms, len(axes)):
-            axes[i].set_visible(False)
+        limit = max(magnitude.max(initial=0.0) * 1.2, 0.1)
+        ax.set_xlim(-limit, limit)
+        ax.set_ylim(-limit, limit)
+        ax.set_aspect('equal')
+        ax.axhline(0, color='gray', linewidth=0.5, alpha=0.4)
+        ax.axvline(0, color='gray', linewidth=0.5, alpha=0.4)
+        ax.set_xlabel('Re', fontsize=9)
+        ax.set_ylabel('Im', fontsize=9)
+        ax.grid(True, alpha=0.3)
         
-        plt.suptitle('Fasores de Fourier (Representación Polar)', 
-                    fontsize=15, fontweight='bold', y=0.995)
-        plt.tight_layout()
+        ax.set_title('Fasores de Fourier (Representación Polar)', 
+                     fontsize=15, fontweight='bold')
+        fig.tight_layout()
         
         return fig
 
-
 def test_epicycles():
     """Función de prueba básica"""
     import sys
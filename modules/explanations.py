@@ -6,8 +6,60 @@ Incluye detección y explicación del fenómeno de Gibbs
 
 import numpy as np
 import sympy as sp
+from types import MappingProxyType
+from threading import Lock, local
+from concurrent.futures import ThreadPoolExecutor
 from sympy import symbols, sin, cos, pi, integrate, latex
-from typing import List, Dict, Tuple, Callable, Optional
+from sympy.printing.str import StrPrinter
+from typing import List, Dict, Iterator, Mapping, Tuple, Callable, Optional
+
+# Impresora de SymPy reutilizada, una por hilo (el Printer guarda estado al
+# recorrer la expresión y las explicaciones se generan en paralelo)
+_printer_local = local()
+
+
+def _sstr(expr) -> str:
+    """Imprime una expresión de SymPy con la StrPrinter del hilo actual"""
+    printer = getattr(_printer_local, 'printer', None)
+    if printer is None:
+        printer = _printer_local.printer = StrPrinter()
+    return printer.doprint(expr)
+
+# Errores esperables al evaluar numéricamente la función en un punto
+_EVAL_ERRORS = (ArithmeticError, TypeError, ValueError)
+
+
+def _display_integral(integrand, limits):
+    """
+    Integral definida para mostrar en una explicación
+    
+    Prueba primero la integración manual (paso a paso, sin las pasadas de
+    simplificación del algoritmo general) y si no logra resolverla usa
+    Integral(...).doit(deep=False).
+    
+    Args:
+        integrand: Expresión a integrar
+        limits: Tupla (variable, inferior, superior)
+        
+    Returns:
+        Resultado de la integral (expresión de SymPy)
+    """
+    try:
+        result = integrate(integrand, limits, manual=True)
+        if not result.has(sp.Integral):
+            return result
+    except Exception:
+        pass
+    return sp.Integral(integrand, limits).doit(deep=False)
+
+
+# Fórmulas LaTeX de la serie (constantes, de solo lectura)
+_LATEX_FORMULAS = MappingProxyType({
+    'general': r'f(x) = \frac{a_0}{2} + \sum_{n=1}^{\infty} \left[a_n \cos\left(\frac{n\pi x}{L}\right) + b_n \sin\left(\frac{n\pi x}{L}\right)\right]',
+    'a0': r'a_0 = \frac{1}{L} \int_{-L}^{L} f(x) \, dx',
+    'an': r'a_n = \frac{1}{L} \int_{-L}^{L} f(x) \cos\left(\frac{n\pi x}{L}\right) \, dx',
+    'bn': r'b_n = \frac{1}{L} \int_{-L}^{L} f(x) \sin\left(\frac{n\pi x}{L}\right) \, dx'
+})
 
 
 class FourierExplanation:
@@ -23,6 +75,16 @@ class FourierExplanation:
         self.solver = solver
         self.steps = []
         
+        # Valores reutilizados por todas las explicaciones (se calculan una vez)
+        self._f_str = str(solver.f_symbolic)
+        self._L = float(solver.L)
+        self._pi_x_over_L = pi * solver.x / solver.L
+        
+        # Integrales ∫f(x)·cos/sin(nπx/L)dx con n simbólico (se calculan al primer uso)
+        # El lock evita que dos hilos calculen la misma plantilla a la vez
+        self._templates = {}
+        self._template_locks = {cos: Lock(), sin: Lock()}
+        
     def explain_theory(self) -> str:
         """Retorna la teoría básica de las series de Fourier"""
         theory = """
@@ -49,10 +111,47 @@ Los coeficientes se calculan mediante:
 """
         return theory
     
+    def _harmonic_integral(self, trig, n: int):
+        """
+        Calcula ∫₋ₗᴸ f(x)·trig(nπx/L) dx para un n concreto
+        
+        La integral se resuelve una sola vez con n simbólico y cada n se obtiene
+        por sustitución; si la plantilla no existe o no da un valor finito para
+        ese n, se integra directamente.
+        
+        Args:
+            trig: cos o sin de SymPy
+            n: Número de armónico
+            
+        Returns:
+            Valor de la integral (expresión de SymPy)
+        """
+        x = self.solver.x
+        L = self._L
+        
+        with self._template_locks[trig]:
+            if trig not in self._templates:
+                try:
+                    # Integración general: con n simbólico devuelve Piecewise para
+                    # los n resonantes, que la integración manual pasaría por alto
+                    self._templates[trig] = integrate(
+                        self.solver.f_symbolic * trig(self.solver.n * self._pi_x_over_L),
+                        (x, -L, L))
+                except Exception:
+                    self._templates[trig] = None
+        
+        template = self._templates[trig]
+        if template is not None:
+            integral = template.subs(self.solver.n, n)
+            if not integral.free_symbols and not integral.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+                return integral
+        
+        return _display_integral(self.solver.f_symbolic * trig(n * self._pi_x_over_L), (x, -L, L))
+    
     def explain_a0_calculation(self) -> str:
         """Explica el cálculo de a₀"""
-        L = self.solver.L
-        f_str = str(self.solver.f_symbolic)
+        L = self._L
+        f_str = self._f_str
         
         explanation = f"""
 ╔═══════════════════════════════════════════════════════════╗
@@ -76,13 +175,14 @@ Paso 2: Calcular la integral
         try:
             # Calcular la integral simbólicamente
             x = self.solver.x
-            integral = integrate(self.solver.f_symbolic, (x, -L, L))
-            explanation += f"    ∫₋{L:.4f}^{L:.4f} ({f_str}) dx = {integral}\n\n"
+            integral = _display_integral(self.solver.f_symbolic, (x, -L, L))
+            integral_str = _sstr(integral)
+            explanation += f"    ∫₋{L:.4f}^{L:.4f} ({f_str}) dx = {integral_str}\n\n"
             
             explanation += f"Paso 3: Dividir por L\n"
             explanation += f"────────────────────────────────────────────────────────────\n"
-            explanation += f"    a₀ = {integral} / {L:.4f} = {self.solver.a0:.6f}\n\n"
-        except:
+            explanation += f"    a₀ = {integral_str} / {L:.4f} = {self.solver.a0:.6f}\n\n"
+        except Exception:
             explanation += f"    (Calculada numéricamente)\n"
             explanation += f"    a₀ ≈ {self.solver.a0:.6f}\n\n"
         
@@ -94,8 +194,8 @@ Paso 2: Calcular la integral
     
     def explain_an_calculation(self, n: int) -> str:
         """Explica el cálculo de aₙ para un n específico"""
-        L = self.solver.L
-        f_str = str(self.solver.f_symbolic)
+        L = self._L
+        f_str = self._f_str
         an_value = self.solver.an_list[n-1] if n <= len(self.solver.an_list) else 0
         
         explanation = f"""
@@ -118,14 +218,13 @@ Paso 3: Calcular la integral
 """
         
         try:
-            x = self.solver.x
-            integrand = self.solver.f_symbolic * cos(n * pi * x / L)
-            integral = integrate(integrand, (x, -L, L))
-            explanation += f"    ∫₋{L:.4f}^{L:.4f} [...] dx = {integral}\n\n"
+            integral = self._harmonic_integral(cos, n)
+            integral_str = _sstr(integral)
+            explanation += f"    ∫₋{L:.4f}^{L:.4f} [...] dx = {integral_str}\n\n"
             explanation += f"Paso 4: Dividir por L\n"
             explanation += f"────────────────────────────────────────────────────────────\n"
-            explanation += f"    a_{n} = {integral} / {L:.4f} = {an_value:.6f}\n\n"
-        except:
+            explanation += f"    a_{n} = {integral_str} / {L:.4f} = {an_value:.6f}\n\n"
+        except Exception:
             explanation += f"    (Calculada numéricamente)\n"
             explanation += f"    a_{n} ≈ {an_value:.6f}\n\n"
         
@@ -137,8 +236,8 @@ Paso 3: Calcular la integral
     
     def explain_bn_calculation(self, n: int) -> str:
         """Explica el cálculo de bₙ para un n específico"""
-        L = self.solver.L
-        f_str = str(self.solver.f_symbolic)
+        L = self._L
+        f_str = self._f_str
         bn_value = self.solver.bn_list[n-1] if n <= len(self.solver.bn_list) else 0
         
         explanation = f"""
@@ -161,14 +260,13 @@ Paso 3: Calcular la integral
 """
         
         try:
-            x = self.solver.x
-            integrand = self.solver.f_symbolic * sin(n * pi * x / L)
-            integral = integrate(integrand, (x, -L, L))
-            explanation += f"    ∫₋{L:.4f}^{L:.4f} [...] dx = {integral}\n\n"
+            integral = self._harmonic_integral(sin, n)
+            integral_str = _sstr(integral)
+            explanation += f"    ∫₋{L:.4f}^{L:.4f} [...] dx = {integral_str}\n\n"
             explanation += f"Paso 4: Dividir por L\n"
             explanation += f"────────────────────────────────────────────────────────────\n"
-            explanation += f"    b_{n} = {integral} / {L:.4f} = {bn_value:.6f}\n\n"
-        except:
+            explanation += f"    b_{n} = {integral_str} / {L:.4f} = {bn_value:.6f}\n\n"
+        except Exception:
             explanation += f"    (Calculada numéricamente)\n"
             explanation += f"    b_{n} ≈ {bn_value:.6f}\n\n"
         
@@ -210,23 +308,25 @@ obtenemos fórmulas generales para cualquier n:
     
     def get_coefficients_summary(self) -> str:
         """Retorna un resumen de todos los coeficientes"""
-        summary = """
+        parts = ["""
 ╔═══════════════════════════════════════════════════════════╗
 ║         RESUMEN DE COEFICIENTES                           ║
 ╚═══════════════════════════════════════════════════════════╝
 
-"""
-        summary += f"a₀ = {self.solver.a0:.6f}\n\n"
-        summary += "  n  │      aₙ      │      bₙ      │  Magnitud\n"
-        summary += "─────┼──────────────┼──────────────┼─────────────\n"
+"""]
+        parts.append(f"a₀ = {self.solver.a0:.6f}\n\n")
+        parts.append("  n  │      aₙ      │      bₙ      │  Magnitud\n")
+        parts.append("─────┼──────────────┼──────────────┼─────────────\n")
         
-        for i, (an, bn) in enumerate(zip(self.solver.an_list, self.solver.bn_list), 1):
-            magnitude = (an**2 + bn**2)**0.5
-            summary += f"  {i:2d} │ {an:12.6f} │ {bn:12.6f} │ {magnitude:11.6f}\n"
+        # Magnitudes de todos los términos en bloque (np.hypot del solver)
+        row = "  %2d │ %12.6f │ %12.6f │ %11.6f\n"
+        for i, (an, bn, magnitude) in enumerate(
+                zip(self.solver.an_arr, self.solver.bn_arr, self.solver.mag_arr), 1):
+            parts.append(row % (i, an, bn, magnitude))
         
-        summary += "\n═══════════════════════════════════════════════════════════\n"
+        parts.append("\n═══════════════════════════════════════════════════════════\n")
         
-        return summary
+        return "".join(parts)
     
     def get_series_construction(self, n_max: int = None) -> str:
         """Muestra cómo se construye la serie término a término"""
@@ -234,57 +334,73 @@ obtenemos fórmulas generales para cualquier n:
             n_max = min(5, len(self.solver.an_list))
         
         L = self.solver.L
-        construction = """
+        parts = ["""
 ╔═══════════════════════════════════════════════════════════╗
 ║         CONSTRUCCIÓN DE LA SERIE                          ║
 ╚═══════════════════════════════════════════════════════════╝
 
 La serie de Fourier se construye sumando términos:
 
-"""
-        construction += f"S₀(x) = a₀/2 = {self.solver.a0/2:.6f}\n\n"
+"""]
+        parts.append(f"S₀(x) = a₀/2 = {self.solver.a0/2:.6f}\n\n")
+        
+        # Términos no nulos marcados en bloque; el sufijo /L se formatea una vez
+        an_arr = self.solver.an_arr[:n_max]
+        bn_arr = self.solver.bn_arr[:n_max]
+        nonzero_a = np.abs(an_arr) > 1e-10
+        nonzero_b = np.abs(bn_arr) > 1e-10
+        suffix = f"πx/{L:.2f})\n"
         
         for n in range(1, n_max + 1):
-            an = self.solver.an_list[n-1]
-            bn = self.solver.bn_list[n-1]
-            
-            construction += f"Término {n}:\n"
-            if abs(an) > 1e-10:
-                construction += f"  + {an:.6f}·cos({n}πx/{L:.2f})\n"
-            if abs(bn) > 1e-10:
-                construction += f"  + {bn:.6f}·sin({n}πx/{L:.2f})\n"
-            construction += f"\nS_{n}(x) = S_{n-1}(x) + término {n}\n\n"
+            parts.append(f"Término {n}:\n")
+            if nonzero_a[n-1]:
+                parts.append(f"  + {an_arr[n-1]:.6f}·cos({n}{suffix}")
+            if nonzero_b[n-1]:
+                parts.append(f"  + {bn_arr[n-1]:.6f}·sin({n}{suffix}")
+            parts.append(f"\nS_{n}(x) = S_{n-1}(x) + término {n}\n\n")
         
-        construction += "═══════════════════════════════════════════════════════════\n"
+        parts.append("═══════════════════════════════════════════════════════════\n")
         
-        return construction
+        return "".join(parts)
     
-    def get_complete_explanation(self) -> str:
-        """Genera la explicación completa"""
-        full_text = self.explain_theory()
-        full_text += "\n" + self.explain_a0_calculation()
+    def iter_complete_explanation(self) -> Iterator[str]:
+        """
+        Genera la explicación completa sección por sección
         
-        # Explicar los primeros 3 términos
-        for n in range(1, min(4, len(self.solver.an_list) + 1)):
-            full_text += "\n" + self.explain_an_calculation(n)
-            full_text += "\n" + self.explain_bn_calculation(n)
+        Cada sección se construye solo cuando se pide, así quien la muestre
+        puede ir presentándolas (o detenerse) sin esperar al texto completo.
         
-        full_text += "\n" + self.explain_symbolic_formulas()
-        full_text += "\n" + self.get_coefficients_summary()
-        full_text += "\n" + self.get_series_construction()
+        Yields:
+            Texto de cada sección, en orden
+        """
+        # Explicar los primeros 3 términos: sus integrales son independientes y
+        # se calculan en paralelo mientras se generan la teoría y a₀
+        ns = range(1, min(4, len(self.solver.an_list) + 1))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(explain, n) for n in ns
+                       for explain in (self.explain_an_calculation, self.explain_bn_calculation)]
+            
+            yield self.explain_theory()
+            yield self.explain_a0_calculation()
+            
+            for future in futures:
+                yield future.result()
         
-        return full_text
+        yield self.explain_symbolic_formulas()
+        yield self.get_coefficients_summary()
+        yield self.get_series_construction()
+    
+    def get_complete_explanation(self) -> str:
+        """Genera la explicación completa"""
+        return "\n".join(self.iter_complete_explanation())
     
-    def get_latex_formulas(self) -> Dict[str, str]:
-        """Retorna las fórmulas en formato LaTeX para visualización"""
-        formulas = {
-            'general': r'f(x) = \frac{a_0}{2} + \sum_{n=1}^{\infty} \left[a_n \cos\left(\frac{n\pi x}{L}\right) + b_n \sin\left(\frac{n\pi x}{L}\right)\right]',
-            'a0': r'a_0 = \frac{1}{L} \int_{-L}^{L} f(x) \, dx',
-            'an': r'a_n = \frac{1}{L} \int_{-L}^{L} f(x) \cos\left(\frac{n\pi x}{L}\right) \, dx',
-            'bn': r'b_n = \frac{1}{L} \int_{-L}^{L} f(x) \sin\left(\frac{n\pi x}{L}\right) \, dx'
-        }
+    def get_latex_formulas(self) -> Mapping[str, str]:
+        """
+        Retorna las fórmulas en formato LaTeX para visualización
         
-        return formulas
+        El diccionario es de solo lectura y compartido; copiarlo para modificarlo.
+        """
+        return _LATEX_FORMULAS
 
 
 def test_explanations():
@@ -309,7 +425,8 @@ if __name__ == "__main__":
 class GibbsExplainer:
     """Detecta y explica el fenómeno de Gibbs en discontinuidades"""
     
-    def __init__(self, func: Callable, period: float, tolerance: float = 0.1):
+    def __init__(self, func: Callable, period: float, tolerance: float = 0.1,
+                 num_samples: int = 4000):
         """
         Inicializa el explicador de Gibbs
         
@@ -317,58 +434,142 @@ class GibbsExplainer:
             func: Función a analizar
             period: Período de la función
             tolerance: Tolerancia para detectar discontinuidades
+            num_samples: Puntos de la malla de muestreo compartida
         """
         self.func = func
         self.period = period
         self.tolerance = tolerance
+        self.num_samples = num_samples
+        
+        # Resultados ya calculados, por (func, period, ...) para invalidarse solos
+        self._grid_cache = {}
+        self._disc_cache = {}
+        self._jump_cache = {}
+    
+    def invalidate(self):
+        """Descarta las muestras y resultados guardados (p. ej. si func cambió por dentro)"""
+        self._grid_cache.clear()
+        self._disc_cache.clear()
+        self._jump_cache.clear()
+    
+    def sample_grid(self, num_samples: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Malla x y muestras f(x) sobre un período, evaluadas una sola vez
+        
+        La malla y las muestras son float32: la mitad de memoria por punto, y
+        su precisión (~7 cifras) sobra para detectar saltos y para graficar.
+        
+        Args:
+            num_samples: Número de puntos (None = self.num_samples)
+            
+        Returns:
+            Tupla (x, y) de arrays de solo lectura, compartidos entre métodos
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+        
+        key = (self.func, self.period, num_samples)
+        if key not in self._grid_cache:
+            x_values = np.linspace(-self.period/2, self.period/2, num_samples, dtype=np.float32)
+            y_values = np.array(self._sample(x_values, np.float32))
+            x_values.flags.writeable = False
+            y_values.flags.writeable = False
+            self._grid_cache[key] = (x_values, y_values)
+        return self._grid_cache[key]
+        
+    def _sample(self, x_values: np.ndarray, dtype=np.float64) -> np.ndarray:
+        """
+        Evalúa la función sobre un array de puntos
+        
+        Intenta una sola llamada vectorizada; si la función no acepta arrays,
+        evalúa punto a punto y deja NaN donde la evaluación falla.
         
-    def detect_discontinuities(self, num_samples: int = 1000) -> list:
+        Args:
+            x_values: Puntos donde evaluar
+            dtype: Tipo de los valores devueltos
+            
+        Returns:
+            Array (de tipo dtype) con los valores de la función
+        """
+        func = self.func
+        
+        try:
+            y_values = np.asarray(func(x_values), dtype=dtype)
+            return np.broadcast_to(y_values, x_values.shape)
+        except Exception:
+            # Cualquier error aquí solo significa que la función no acepta arrays
+            pass
+        
+        # Punto a punto: el try envuelve el bucle y solo se reentra tras un fallo
+        y_values = np.full(len(x_values), np.nan, dtype=dtype)
+        i = 0
+        while i < len(x_values):
+            try:
+                for i in range(i, len(x_values)):
+                    y_values[i] = func(x_values[i])
+                break
+            except _EVAL_ERRORS:
+                i += 1  # El punto que falló queda en NaN
+        return y_values
+    
+    def detect_discontinuities(self, num_samples: Optional[int] = None) -> list:
         """
         Detecta discontinuidades en la función
         
         Args:
-            num_samples: Número de puntos a evaluar
+            num_samples: Número de puntos a evaluar (None = self.num_samples)
             
         Returns:
             Lista de posiciones x donde hay discontinuidades
         """
-        x_values = np.linspace(-self.period/2, self.period/2, num_samples)
-        discontinuities = []
+        return list(self._scan(num_samples)[0])
+    
+    def _scan(self, num_samples: Optional[int] = None) -> Tuple[list, np.ndarray]:
+        """
+        Muestrea la función una vez y localiza las discontinuidades (memoizado)
         
-        for i in range(len(x_values) - 1):
-            x1, x2 = x_values[i], x_values[i+1]
+        Además de las posiciones guarda el salto |y[i+1] - y[i]| medido en la
+        propia malla, para no volver a evaluar la función en cada discontinuidad.
+        Las muestras salen de sample_grid.
+        
+        Args:
+            num_samples: Número de puntos a evaluar (None = self.num_samples)
             
-            try:
-                # Calcular límites
-                y1 = self.func(x1)
-                y2 = self.func(x2)
-                
-                # Detectar salto brusco
-                jump = abs(y2 - y1)
-                dx = abs(x2 - x1)
-                
-                # Si la derivada es muy grande, hay discontinuidad
-                if dx > 0 and jump / dx > 100:  # Pendiente > 100
-                    discontinuities.append(x1)
-                    
-            except:
-                # Error al evaluar puede indicar discontinuidad
-                discontinuities.append(x1)
+        Returns:
+            Tupla (posiciones, saltos) de las discontinuidades
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+        
+        key = (self.func, self.period, num_samples)
+        if key in self._disc_cache:
+            return self._disc_cache[key]
+        
+        x_values, y_values = self.sample_grid(num_samples)
+        
+        # Pendiente entre puntos consecutivos: salto brusco si es > 100
+        # Sin ramas: ~(slope <= 100) también marca NaN (error al evaluar o inf - inf)
+        # e infinitos, que igualmente pueden indicar discontinuidad
+        with np.errstate(all='ignore'):
+            steps = np.abs(np.diff(y_values))
+            slope = steps / np.diff(x_values)
+            idx = np.flatnonzero(~(slope <= 100))
         
         # Eliminar discontinuidades muy cercanas (mismo punto)
-        if discontinuities:
-            unique_disc = [discontinuities[0]]
-            for d in discontinuities[1:]:
-                if abs(d - unique_disc[-1]) > self.period / 100:
-                    unique_disc.append(d)
-            return unique_disc
+        if idx.size:
+            idx = idx[np.concatenate(([True], np.diff(x_values[idx]) > self.period / 100))]
         
-        return []
+        result = (x_values[idx].tolist(), steps[idx])
+        self._disc_cache[key] = result
+        return result
     
     def calculate_jump_size(self, x_disc: float) -> float:
         """
         Calcula el tamaño del salto en una discontinuidad
         
+        Auxiliar para un punto suelto; las explicaciones usan los saltos que
+        mide _analyze durante la detección.
+        
         Args:
             x_disc: Posición de la discontinuidad
             
@@ -381,32 +582,84 @@ class GibbsExplainer:
             left_limit = self.func(x_disc - epsilon)
             right_limit = self.func(x_disc + epsilon)
             return abs(right_limit - left_limit)
-        except:
+        except _EVAL_ERRORS:
             return 0.0
     
-    def get_gibbs_explanation(self) -> Optional[str]:
+    def calculate_jump_sizes_from_cache(self, num_samples: Optional[int] = None) -> np.ndarray:
         """
-        Genera explicación del fenómeno de Gibbs si aplica
+        Tamaño de los saltos en las discontinuidades detectadas, medido sobre
+        las muestras de detect_discontinuities (sin evaluar de nuevo la función)
         
+        Args:
+            num_samples: Número de puntos de la malla de detección (None = self.num_samples)
+            
         Returns:
-            Texto explicativo o None si no hay discontinuidades
+            Array con el salto de cada discontinuidad (NaN si no se pudo evaluar)
         """
-        discontinuities = self.detect_discontinuities()
+        return self._scan(num_samples)[1].copy()
+    
+    def calculate_jump_sizes(self, x_discs) -> np.ndarray:
+        """
+        Calcula el tamaño del salto en varias discontinuidades a la vez
         
-        if not discontinuities:
-            return None
+        Args:
+            x_discs: Posiciones de las discontinuidades
+            
+        Returns:
+            Array con el tamaño de cada salto (NaN si no se pudo evaluar)
+        """
+        epsilon = self.period / 10000  # Punto muy cercano
+        x_discs = np.asarray(x_discs, dtype=float)
         
-        # Calcular tamaño promedio de saltos
-        jumps = [self.calculate_jump_size(d) for d in discontinuities]
-        valid_jumps = [j for j in jumps if j > 0 and not np.isnan(j)]
+        left_limits = self._sample(x_discs - epsilon)
+        right_limits = self._sample(x_discs + epsilon)
+        return np.abs(right_limits - left_limits)
+    
+    def _analyze(self, num_samples: Optional[int] = None) -> Optional[Tuple[list, float]]:
+        """
+        Detecta las discontinuidades y promedia sus saltos en una sola pasada
         
-        if not valid_jumps:
-            return None
+        Posiciones y saltos salen del mismo muestreo denso de la función, sin
+        volver a evaluarla en cada discontinuidad (memoizado).
         
-        avg_jump = np.mean(valid_jumps)
+        Args:
+            num_samples: Número de puntos de la malla (None = self.num_samples)
+            
+        Returns:
+            Tupla (discontinuidades, salto_promedio) o None si no hay un salto
+            válido mayor que la tolerancia
+        """
+        if num_samples is None:
+            num_samples = self.num_samples
+        
+        key = (self.func, self.period, self.tolerance, num_samples)
+        if key in self._jump_cache:
+            return self._jump_cache[key]
+        
+        result = None
+        discontinuities, jumps = self._scan(num_samples)
+        if discontinuities:
+            # Calcular tamaño promedio de saltos
+            valid_jumps = jumps[np.isfinite(jumps) & (jumps > 0)]
+            if valid_jumps.size:
+                avg_jump = float(np.mean(valid_jumps))
+                if avg_jump >= self.tolerance:
+                    result = (discontinuities, avg_jump)
+        
+        self._jump_cache[key] = result
+        return result
+    
+    def get_gibbs_explanation(self) -> Optional[str]:
+        """
+        Genera explicación del fenómeno de Gibbs si aplica
         
-        if avg_jump < self.tolerance or np.isnan(avg_jump):
+        Returns:
+            Texto explicativo o None si no hay discontinuidades
+        """
+        analysis = self._analyze()
+        if analysis is None:
             return None
+        discontinuities, avg_jump = analysis
         
         # Generar explicación
         explanation = f"""
@@ -475,21 +728,10 @@ Este valor es CONSTANTE, probado por Josiah Willard Gibbs (1899)
     
     def get_short_explanation(self) -> Optional[str]:
         """Versión corta de la explicación para la GUI"""
-        discontinuities = self.detect_discontinuities()
-        
-        if not discontinuities:
-            return None
-        
-        jumps = [self.calculate_jump_size(d) for d in discontinuities]
-        valid_jumps = [j for j in jumps if j > 0 and not np.isnan(j)]
-        
-        if not valid_jumps:
-            return None
-            
-        avg_jump = np.mean(valid_jumps)
-        
-        if avg_jump < self.tolerance or np.isnan(avg_jump):
+        analysis = self._analyze()
+        if analysis is None:
             return None
+        discontinuities, avg_jump = analysis
         
         return f"""⚠️ FENÓMENO DE GIBBS DETECTADO
 {len(discontinuities)} discontinuidad(es) encontrada(s)
@@ -3,7 +3,215 @@ Módulo function_library.py - Biblioteca de Funciones Famosas
 Colección de funciones periódicas clásicas con sus propiedades
 """
 
-import numpy as np
+from math import pi, tau
+from types import MappingProxyType
+
+
+# Biblioteca de funciones (constante: se construye una sola vez al importar)
+_LIBRARY = {
+    # ONDAS BÁSICAS
+    'square_wave': {
+        'name': 'Onda Cuadrada',
+        'function': 'sign(x)',
+        'period': tau,
+        'description': 'Onda cuadrada clásica. Alterna entre +1 y -1.',
+        'properties': [
+            'Solo términos impares de seno',
+            'bₙ = 4/(nπ) para n impar',
+            'Convergencia lenta (1/n)',
+            'Muestra fenómeno de Gibbs en discontinuidades'
+        ],
+        'applications': 'Electrónica digital, relojes, PWM',
+        'terms_recommended': 50,
+        'difficulty': 'Medio'
+    },
+    
+    'triangular_wave': {
+        'name': 'Onda Triangular',
+        'function': '(2/pi)*arcsin(sin(x))',
+        'function_alt': 'abs(x) - pi/2',  # Aproximación
+        'period': tau,
+        'description': 'Onda triangular simétrica.',
+        'properties': [
+            'Solo términos impares de coseno',
+            'Convergencia rápida (1/n²)',
+            'Función continua',
+            'Derivada es onda cuadrada'
+        ],
+        'applications': 'Síntesis de audio, generadores de señal',
+        'terms_recommended': 20,
+        'difficulty': 'Medio'
+    },
+    
+    'sawtooth_wave': {
+        'name': 'Diente de Sierra',
+        'function': 'x',
+        'period': tau,
+        'description': 'Función lineal periódica (rampa).',
+        'properties': [
+            'Todos los términos de seno',
+            'bₙ = (-1)^(n+1) * 2/n',
+            'Convergencia moderada (1/n)',
+            'Rica en armónicos'
+        ],
+        'applications': 'Síntesis de sonido, osciladores',
+        'terms_recommended': 30,
+        'difficulty': 'Fácil'
+    },
+    
+    # PULSOS
+    'pulse_train': {
+        'name': 'Tren de Pulsos',
+        'function': '1 if abs(x) < pi/4 else 0',
+        'function_code': 'np.where(np.abs(x) < np.pi/4, 1, 0)',
+        'period': tau,
+        'description': 'Secuencia de pulsos rectangulares.',
+        'properties': [
+            'Función sinc en frecuencia',
+            'Todos los armónicos presentes',
+            'Fenómeno de Gibbs pronunciado'
+        ],
+        'applications': 'Comunicaciones digitales, muestreo',
+        'terms_recommended': 40,
+        'difficulty': 'Medio'
+    },
+    
+    # FUNCIONES SUAVES
+    'parabola': {
+        'name': 'Parábola',
+        'function': 'x**2',
+        'period': tau,
+        'description': 'Función cuadrática periódica.',
+        'properties': [
+            'Función par: solo cosenos',
+            'Convergencia muy rápida',
+            'Suave y continua',
+            'Derivada es lineal'
+        ],
+        'applications': 'Trayectorias, física',
+        'terms_recommended': 10,
+        'difficulty': 'Fácil'
+    },
+    
+    'gaussian': {
+        'name': 'Gaussiana Periódica',
+        'function': 'exp(-x**2/4)',
+        'period': tau,
+        'description': 'Campana de Gauss periódica.',
+        'properties': [
+            'Función par: solo cosenos',
+            'Muy suave',
+            'Convergencia excelente',
+            'Espectro gaussiano'
+        ],
+        'applications': 'Probabilidad, procesamiento de señales',
+        'terms_recommended': 15,
+        'difficulty': 'Medio'
+    },
+    
+    # FUNCIONES COMBINADAS
+    'am_signal': {
+        'name': 'Señal AM (Modulada en Amplitud)',
+        'function': '(1 + 0.5*cos(x))*cos(5*x)',
+        'period': tau,
+        'description': 'Señal modulada en amplitud.',
+        'properties': [
+            'Portadora más bandas laterales',
+            'Espectro con 3 picos principales',
+            'Demodulación por envolvente'
+        ],
+        'applications': 'Radio AM, telecomunicaciones',
+        'terms_recommended': 25,
+        'difficulty': 'Avanzado'
+    },
+    
+    'beat_signal': {
+        'name': 'Batimiento',
+        'function': 'cos(9*x) + cos(11*x)',
+        'period': tau,
+        'description': 'Suma de dos frecuencias cercanas.',
+        'properties': [
+            'Envolvente de baja frecuencia',
+            'Solo 2 componentes espectrales',
+            'Patrón de batimiento audible'
+        ],
+        'applications': 'Acústica, afinación de instrumentos',
+        'terms_recommended': 15,
+        'difficulty': 'Medio'
+    },
+    
+    # FUNCIONES ESPECIALES
+    'rectified_sine': {
+        'name': 'Seno Rectificado',
+        'function': 'abs(sin(x))',
+        'period': pi,
+        'description': 'Valor absoluto de seno (rectificación).',
+        'properties': [
+            'Solo términos pares de coseno',
+            'Período es π, no 2π',
+            'Aplicación en rectificadores'
+        ],
+        'applications': 'Fuentes de alimentación, rectificadores',
+        'terms_recommended': 20,
+        'difficulty': 'Medio'
+    },
+    
+    'chirp': {
+        'name': 'Chirp Lineal',
+        'function': 'sin(x**2/2)',
+        'period': tau,
+        'description': 'Frecuencia variable (chirp).',
+        'properties': [
+            'Frecuencia instantánea variable',
+            'Espectro distribuido',
+            'No armónico'
+        ],
+        'applications': 'Radar, sonar, análisis tiempo-frecuencia',
+        'terms_recommended': 50,
+        'difficulty': 'Avanzado'
+    },
+    
+    # FUNCIONES CLÁSICAS
+    'abs_x': {
+        'name': 'Valor Absoluto',
+        'function': 'abs(x)',
+        'period': tau,
+        'description': 'Función valor absoluto periódica.',
+        'properties': [
+            'Función par: solo cosenos',
+            'Continua pero no derivable en 0',
+            'Convergencia buena'
+        ],
+        'applications': 'Rectificadores, distorsión',
+        'terms_recommended': 25,
+        'difficulty': 'Fácil'
+    },
+    
+    'cubic': {
+        'name': 'Cúbica',
+        'function': 'x**3',
+        'period': tau,
+        'description': 'Función cúbica periódica.',
+        'properties': [
+            'Función impar: solo senos',
+            'Convergencia muy rápida',
+            'Suave'
+        ],
+        'applications': 'Matemáticas, modelado',
+        'terms_recommended': 12,
+        'difficulty': 'Fácil'
+    }
+}
+
+# Todas las instancias comparten la tabla: de solo lectura también por dentro
+_LIBRARY = MappingProxyType({
+    key: MappingProxyType(dict(info, properties=tuple(info['properties'])))
+    for key, info in _LIBRARY.items()
+})
+
+# Claves y nombres en el orden de la biblioteca
+_ALL_KEYS = tuple(_LIBRARY)
+_ALL_NAMES = tuple(info['name'] for info in _LIBRARY.values())
 
 
 class FunctionLibrary:
@@ -11,204 +219,8 @@ class FunctionLibrary:
     
     def __init__(self):
         """Inicializa la biblioteca"""
-        self.functions = self._create_library()
-    
-    def _create_library(self):
-        """Crea la biblioteca de funciones"""
-        return {
-            # ONDAS BÁSICAS
-            'square_wave': {
-                'name': 'Onda Cuadrada',
-                'function': 'sign(x)',
-                'period': 2 * np.pi,
-                'description': 'Onda cuadrada clásica. Alterna entre +1 y -1.',
-                'properties': [
-                    'Solo términos impares de seno',
-                    'bₙ = 4/(nπ) para n impar',
-                    'Convergencia lenta (1/n)',
-                    'Muestra fenómeno de Gibbs en discontinuidades'
-                ],
-                'applications': 'Electrónica digital, relojes, PWM',
-                'terms_recommended': 50,
-                'difficulty': 'Medio'
-            },
-            
-            'triangular_wave': {
-                'name': 'Onda Triangular',
-                'function': '(2/pi)*arcsin(sin(x))',
-                'function_alt': 'abs(x) - pi/2',  # Aproximación
-                'period': 2 * np.pi,
-                'description': 'Onda triangular simétrica.',
-                'properties': [
-                    'Solo términos impares de coseno',
-                    'Convergencia rápida (1/n²)',
-                    'Función continua',
-                    'Derivada es onda cuadrada'
-                ],
-                'applications': 'Síntesis de audio, generadores de señal',
-                'terms_recommended': 20,
-                'difficulty': 'Medio'
-            },
-            
-            'sawtooth_wave': {
-                'name': 'Diente de Sierra',
-                'function': 'x',
-                'period': 2 * np.pi,
-                'description': 'Función lineal periódica (rampa).',
-                'properties': [
-                    'Todos los términos de seno',
-                    'bₙ = (-1)^(n+1) * 2/n',
-                    'Convergencia moderada (1/n)',
-                    'Rica en armónicos'
-                ],
-                'applications': 'Síntesis de sonido, osciladores',
-                'terms_recommended': 30,
-                'difficulty': 'Fácil'
-            },
-            
-            # PULSOS
-            'pulse_train': {
-                'name': 'Tren de Pulsos',
-                'function': '1 if abs(x) < pi/4 else 0',
-                'function_code': 'np.where(np.abs(x) < np.pi/4, 1, 0)',
-                'period': 2 * np.pi,
-                'description': 'Secuencia de pulsos rectangulares.',
-                'properties': [
-                    'Función sinc en frecuencia',
-                    'Todos los armónicos presentes',
-                    'Fenómeno de Gibbs pronunciado'
-                ],
-                'applications': 'Comunicaciones digitales, muestreo',
-                'terms_recommended': 40,
-                'difficulty': 'Medio'
-            },
-            
-            # FUNCIONES SUAVES
-            'parabola': {
-                'name': 'Parábola',
-                'function': 'x**2',
-                'period': 2 * np.pi,
-                'description': 'Función cuadrática periódica.',
-                'properties': [
-                    'Función par: solo cosenos',
-                    'Convergencia muy rápida',
-                    'Suave y continua',
-                    'Derivada es lineal'
-                ],
-                'applications': 'Trayectorias, física',
-                'terms_recommended': 10,
-                'difficulty': 'Fácil'
-            },
-            
-            'gaussian': {
-                'name': 'Gaussiana Periódica',
-                'function': 'exp(-x**2/4)',
-                'period': 2 * np.pi,
-                'description': 'Campana de Gauss periódica.',
-                'properties': [
-                    'Función par: solo cosenos',
-                    'Muy suave',
-                    'Convergencia excelente',
-                    'Espectro gaussiano'
-                ],
-                'applications': 'Probabilidad, procesamiento de señales',
-                'terms_recommended': 15,
-                'difficulty': 'Medio'
-            },
-            
-            # FUNCIONES COMBINADAS
-            'am_signal': {
-                'name': 'Señal AM (Modulada en Amplitud)',
-                'function': '(1 + 0.5*cos(x))*cos(5*x)',
-                'period': 2 * np.pi,
-                'description': 'Señal modulada en amplitud.',
-                'properties': [
-                    'Portadora más bandas laterales',
-                    'Espectro con 3 picos principales',
-                    'Demodulación por envolvente'
-                ],
-                'applications': 'Radio AM, telecomunicaciones',
-                'terms_recommended': 25,
-                'difficulty': 'Avanzado'
-            },
-            
-            'beat_signal': {
-                'name': 'Batimiento',
-                'function': 'cos(9*x) + cos(11*x)',
-                'period': 2 * np.pi,
-                'description': 'Suma de dos frecuencias cercanas.',
-                'properties': [
-                    'Envolvente de baja frecuencia',
-                    'Solo 2 componentes espectrales',
-                    'Patrón de batimiento audible'
-                ],
-                'applications': 'Acústica, afinación de instrumentos',
-                'terms_recommended': 15,
-                'difficulty': 'Medio'
-            },
-            
-            # FUNCIONES ESPECIALES
-            'rectified_sine': {
-                'name': 'Seno Rectificado',
-                'function': 'abs(sin(x))',
-                'period': np.pi,
-                'description': 'Valor absoluto de seno (rectificación).',
-                'properties': [
-                    'Solo términos pares de coseno',
-                    'Período es π, no 2π',
-                    'Aplicación en rectificadores'
-                ],
-                'applications': 'Fuentes de alimentación, rectificadores',
-                'terms_recommended': 20,
-                'difficulty': 'Medio'
-            },
-            
-            'chirp': {
-                'name': 'Chirp Lineal',
-                'function': 'sin(x**2/2)',
-                'period': 2 * np.pi,
-                'description': 'Frecuencia variable (chirp).',
-                'properties': [
-                    'Frecuencia instantánea variable',
-                    'Espectro distribuido',
-                    'No armónico'
-                ],
-                'applications': 'Radar, sonar, análisis tiempo-frecuencia',
-                'terms_recommended': 50,
-                'difficulty': 'Avanzado'
-            },
-            
-            # FUNCIONES CLÁSICAS
-            'abs_x': {
-                'name': 'Valor Absoluto',
-                'function': 'abs(x)',
-                'period': 2 * np.pi,
-                'description': 'Función valor absoluto periódica.',
-                'properties': [
-                    'Función par: solo cosenos',
-                    'Continua pero no derivable en 0',
-                    'Convergencia buena'
-                ],
-                'applications': 'Rectificadores, distorsión',
-                'terms_recommended': 25,
-                'difficulty': 'Fácil'
-            },
-            
-            'cubic': {
-                'name': 'Cúbica',
-                'function': 'x**3',
-                'period': 2 * np.pi,
-                'description': 'Función cúbica periódica.',
-                'properties': [
-                    'Función impar: solo senos',
-                    'Convergencia muy rápida',
-                    'Suave'
-                ],
-                'applications': 'Matemáticas, modelado',
-                'terms_recommended': 12,
-                'difficulty': 'Fácil'
-            }
-        }
+        # Todas las instancias comparten la misma tabla de solo lectura
+        self.functions = _LIBRARY
     
     def get_function(self, key):
         """
@@ -218,17 +230,21 @@ class FunctionLibrary:
             key: Clave de la función
             
         Returns:
-            Diccionario con información de la función
+            Diccionario con información de la función (copia propia: se
+            puede modificar sin afectar a la biblioteca), o None
         """
-        return self.functions.get(key, None)
+        info = self.functions.get(key)
+        if info is None:
+            return None
+        return dict(info, properties=list(info['properties']))
     
     def get_all_names(self):
-        """Retorna lista de nombres de todas las funciones"""
-        return [info['name'] for info in self.functions.values()]
+        """Retorna lista con los nombres de todas las funciones"""
+        return list(_ALL_NAMES)
     
     def get_all_keys(self):
-        """Retorna lista de todas las claves"""
-        return list(self.functions.keys())
+        """Retorna lista con todas las claves"""
+        return list(_ALL_KEYS)
     
     def get_by_difficulty(self, difficulty):
         """
@@ -268,7 +284,7 @@ class FunctionLibrary:
         if not func:
             return "Función no encontrada"
         
-        text = f"""
+        parts = [f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║  {func['name'].upper().center(58)}  ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -280,11 +296,9 @@ Descripción:
 {func['description']}
 
 Propiedades de la Serie de Fourier:
-"""
-        for prop in func['properties']:
-            text += f"  • {prop}\n"
-        
-        text += f"""
+"""]
+        parts.extend(f"  • {prop}\n" for prop in func['properties'])
+        parts.append(f"""
 Aplicaciones:
 {func['applications']}
 
@@ -292,8 +306,8 @@ Términos Recomendados: {func['terms_recommended']}
 Dificultad: {func['difficulty']}
 
 ══════════════════════════════════════════════════════════════
-"""
-        return text
+""")
+        return "".join(parts)
 
 
 def test_library():
@@ -4,11 +4,540 @@ Analiza la función y sugiere parámetros óptimos para la aproximación
 """
 
 import numpy as np
-from typing import Callable, Dict, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+# Numba es opcional: si está instalado, los recorridos de análisis se compilan
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _disc_kernel_numpy(x, dx, y, period, derivatives):
+    """
+    Índices de las discontinuidades de y(x) con operaciones de NumPy
+    
+    Un punto es discontinuidad si |dy/dx| supera media + 5·desviación de
+    |dy/dx|; los candidatos a menos de period/100 del candidato anterior se
+    consideran parte del mismo salto y se descartan.
+    
+    Args:
+        x: Puntos de muestreo (crecientes)
+        dx: np.diff(x) + 1e-10 (precalculado junto con x)
+        y: Valores de la función en x
+        period: Período de la función
+        derivatives: Buffer de trabajo de len(x) - 1 elementos (se sobrescribe)
+        
+    Returns:
+        Array con los índices i de las discontinuidades (entre x[i] y x[i+1])
+    """
+    np.subtract(y[1:], y[:-1], out=derivatives)
+    np.divide(derivatives, dx, out=derivatives)
+    np.abs(derivatives, out=derivatives)
+    threshold = np.mean(derivatives) + 5 * np.std(derivatives)
+    disc_indices = np.flatnonzero(derivatives > threshold)
+    
+    # Eliminar duplicados muy cercanos (x es creciente: basta la diferencia)
+    if disc_indices.size:
+        keep = np.empty(disc_indices.size, dtype=np.bool_)
+        keep[0] = True
+        np.greater(np.diff(x[disc_indices]), period / 100, out=keep[1:])
+        disc_indices = disc_indices[keep]
+    return disc_indices
+
+
+def _disc_kernel_loops(x, dx, y, period, derivatives):
+    """Versión con bucles de _disc_kernel_numpy, pensada para compilarse con Numba"""
+    n = y.shape[0] - 1
+    total = 0.0
+    for i in range(n):
+        d = abs((y[i + 1] - y[i]) / dx[i])
+        derivatives[i] = d
+        total += d
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    
+    mean = total / n
+    var = 0.0
+    for i in range(n):
+        diff = derivatives[i] - mean
+        var += diff * diff
+    threshold = mean + 5 * np.sqrt(var / n)
+    
+    min_gap = period / 100
+    out = np.empty(n, dtype=np.int64)
+    count = 0
+    prev = -1
+    for i in range(n):
+        if derivatives[i] > threshold:
+            if prev < 0 or x[i] - x[prev] > min_gap:
+                out[count] = i
+                count += 1
+            prev = i
+    return out[:count]
+
+
+def _smooth_kernel_numpy(y, d2y):
+    """
+    Desviación típica de la segunda diferencia de y (curvatura) con NumPy
+    
+    Args:
+        y: Valores de la función (al menos 3)
+        d2y: Buffer de trabajo de len(y) - 2 elementos (se sobrescribe)
+        
+    Returns:
+        Desviación típica de y[i+2] - 2·y[i+1] + y[i]
+    """
+    np.subtract(y[2:], y[1:-1], out=d2y)
+    d2y -= y[1:-1]
+    d2y += y[:-2]
+    return np.std(d2y)
+
+
+def _smooth_kernel_loops(y, d2y):
+    """Versión con bucles de _smooth_kernel_numpy, pensada para compilarse con Numba"""
+    n = y.shape[0] - 2
+    total = 0.0
+    for i in range(n):
+        d = y[i + 2] - 2 * y[i + 1] + y[i]
+        d2y[i] = d
+        total += d
+    mean = total / n
+    var = 0.0
+    for i in range(n):
+        diff = d2y[i] - mean
+        var += diff * diff
+    return np.sqrt(var / n)
+
+
+# Kernels de análisis: compilados con Numba si está disponible. Sin fastmath,
+# porque las funciones pueden devolver NaN/inf y la comparación con el umbral
+# debe comportarse igual que en NumPy
+if njit is not None:
+    _disc_kernel = njit(cache=True)(_disc_kernel_loops)
+    _smooth_kernel = njit(cache=True)(_smooth_kernel_loops)
+    # Pagar la compilación al importar y no en el primer análisis
+    # con x y dx de solo lectura, igual que la malla de _sampling_grid
+    _warmup = np.linspace(0.0, 1.0, 8)
+    _warmup_x = _warmup.copy()
+    _warmup_dx = np.diff(_warmup) + 1e-10
+    _warmup_x.flags.writeable = False
+    _warmup_dx.flags.writeable = False
+    _disc_kernel(_warmup_x, _warmup_dx, _warmup, 1.0, np.empty(7))
+    _smooth_kernel(_warmup, np.empty(6))
+    del _warmup, _warmup_x, _warmup_dx
+else:
+    _disc_kernel = _disc_kernel_numpy
+    _smooth_kernel = _smooth_kernel_numpy
+
+
+# Tablas de consulta de las recomendaciones (constantes)
+_COMPLEXITY_LABELS = ('simple', 'medium', 'high', 'extreme')
+
+# Umbrales de puntuación de _classify_complexity
+_DISC_BINS = np.array([0, 2, 5])          # n_disc > umbral suma 2 puntos
+_HF_BINS = np.array([0.1, 0.3, 0.5])      # high_freq >= umbral suma 1 punto
+_SM_BINS = np.array([0.3, 0.5, 0.8])      # smoothness <= umbral suma 1 punto
+
+# Puntuación máxima de cada nivel de complejidad (el último no tiene límite)
+_SCORE_BINS = np.array([2, 5, 8])
+
+_COMPLEXITY_NAMES = {
+    'simple': 'SIMPLE',
+    'medium': 'MODERADA',
+    'high': 'ALTA',
+    'extreme': 'MUY ALTA'
+}
+
+# Términos base según complejidad
+_BASE_TERMS = {
+    'simple': 20,
+    'medium': 50,
+    'high': 100,
+    'extreme': 200
+}
+
+# Perfil de análisis de las funciones de la biblioteca según su dificultad:
+# (complejidad, contenido de altas frecuencias, suavidad) representativos
+_DIFFICULTY_PROFILES = {
+    'Fácil': ('simple', 0.05, 0.9),
+    'Medio': ('medium', 0.2, 0.6),
+    'Avanzado': ('high', 0.4, 0.4)
+}
+
+# Indicios de salto en la descripción/propiedades de una función de la
+# biblioteca (Gibbs, discontinuidades o coeficientes que decaen como 1/n)
+_JUMP_MARKERS = ('gibbs', 'discontinu', '(1/n)')
+
+# Fragmentos fijos del texto de _explain_recommendations
+_EXPLANATION_HEADER = """
+╔═══════════════════════════════════════════════════════════════╗
+║           🎯 RECOMENDACIÓN INTELIGENTE DE PARÁMETROS           ║
+╚═══════════════════════════════════════════════════════════════╝
+
+📊 ANÁLISIS DE LA FUNCIÓN:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Complejidad: {complexity}
+Discontinuidades: {n_disc}
+Contenido de altas frecuencias: {high_freq:.1%}
+Suavidad: {smoothness:.1%}
+
+💡 RECOMENDACIONES:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✓ Número de términos: {n_terms}
+✓ Velocidad de animación: {speed}
+✓ Tipo de ventana: {window}
+
+📝 JUSTIFICACIÓN:
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+_TERMS_EXPLANATIONS = {
+    'simple': ("• {n_terms} términos son SUFICIENTES para esta función suave\n"
+               "  Más términos NO mejorarán significativamente la aproximación\n\n"),
+    'medium': ("• {n_terms} términos logran buen balance precisión/velocidad\n"
+               "  La función tiene complejidad moderada\n\n"),
+    'high': ("• {n_terms} términos son NECESARIOS para capturar los detalles\n"
+             "  La función tiene alta complejidad y/o discontinuidades\n\n"),
+    'extreme': ("• {n_terms} términos son el MÍNIMO para aproximación razonable\n"
+                "  ⚠️ Función muy compleja, considera simplificarla\n\n")
+}
+
+_WINDOW_EXPLANATIONS = {
+    'Rectangular': "• Ventana RECTANGULAR: sin discontinuidades, no es necesaria\n",
+    'Hann': "• Ventana HANN: reduce el fenómeno de Gibbs suavemente\n",
+    'Hamming': "• Ventana HAMMING: mejor reducción de Gibbs para múltiples discontinuidades\n"
+}
+
+_EXPLANATION_FOOTER = """
+╔═══════════════════════════════════════════════════════════════╗
+║  💡 Sugerencia: Acepta estas recomendaciones para resultados   ║
+║     óptimos, o ajusta manualmente según tus necesidades        ║
+╚═══════════════════════════════════════════════════════════════╝
+"""
+
+
+# Análisis de una función que no se pudo evaluar
+_FAILED_ANALYSIS = {
+    'complexity': 'extreme',
+    'discontinuities': -1,
+    'high_frequency_content': 1.0,
+    'smoothness': 0.0
+}
+
+
+@lru_cache(maxsize=8)
+def _sampling_grid(L: float, num_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Malla de análisis en [-L, L] (cacheada, de solo lectura)
+    
+    Args:
+        L: Semiperíodo
+        num_samples: Número de puntos
+        
+    Returns:
+        Tupla (x, dx) con dx = diff(x) + 1e-10
+    """
+    x = np.linspace(-L, L, num_samples)
+    dx = np.diff(x) + 1e-10
+    x.flags.writeable = False
+    dx.flags.writeable = False
+    return x, dx
+
+
+def _scratch_buffers(num_samples: int) -> Dict:
+    """Buffers de trabajo de los kernels para num_samples puntos"""
+    return {
+        'n': num_samples,
+        'derivatives': np.empty(max(num_samples - 1, 0)),
+        'd2y': np.empty(max(num_samples - 2, 0))
+    }
+
+
+def _sample(func: Callable, x: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Evalúa func en la malla x
+    
+    Args:
+        func: Función a analizar
+        x: Puntos de muestreo
+        
+    Returns:
+        Array float64 con func(x), o None si la función no se puede evaluar
+    """
+    try:
+        # Evaluación vectorizada: una sola llamada sobre todo el array
+        y = np.asarray(func(x), dtype=np.float64)
+        if y.shape != x.shape:
+            raise ValueError("la función no devolvió un valor por punto")
+        return y
+    except Exception:
+        # Si no admite arrays, evaluar punto a punto sin lista intermedia
+        try:
+            return np.fromiter((func(float(xi)) for xi in x),
+                               dtype=np.float64, count=len(x))
+        except Exception:
+            return None
+
+
+def _discontinuity_indices(x: np.ndarray, y: np.ndarray, period: float,
+                           dx: np.ndarray = None, derivatives: np.ndarray = None) -> np.ndarray:
+    """
+    Índices de las discontinuidades de la función
+    
+    Args:
+        x: Puntos de muestreo (crecientes, float64 contiguo)
+        y: Valores de la función en x
+        period: Período de la función
+        dx: np.diff(x) + 1e-10 si ya está calculado (opcional)
+        derivatives: Buffer de trabajo de len(x) - 1 elementos (opcional)
+        
+    Returns:
+        Array con los índices i de las discontinuidades (entre x[i] y x[i+1])
+    """
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if dx is None:
+        dx = np.diff(x) + 1e-10
+    if derivatives is None:
+        derivatives = np.empty(max(len(x) - 1, 0))
+    return _disc_kernel(x, dx, y, float(period), derivatives)
+
+
+def _detect_discontinuities(x: np.ndarray, y: np.ndarray, period: float) -> list:
+    """
+    Detecta discontinuidades en la función
+    
+    Args:
+        x: Puntos de muestreo (crecientes)
+        y: Valores de la función en x
+        period: Período de la función
+        
+    Returns:
+        Lista con las posiciones x de las discontinuidades
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    return x[_discontinuity_indices(x, y, period)].tolist()
+
+
+def _frequency_content(y: np.ndarray) -> float:
+    """
+    Analiza el contenido de altas frecuencias usando FFT
+    
+    Returns:
+        Proporción de energía en altas frecuencias (0-1)
+    """
+    # FFT real de la señal: solo las frecuencias no negativas (0..n/2)
+    Y = np.fft.rfft(y)
+    
+    # Potencia re² + im² sin sqrt ni array intermedio: se elevan al cuadrado
+    # en su sitio las partes (re, im) intercaladas del propio Y y se suman
+    # tramos contiguos (el bin k ocupa las posiciones 2k y 2k+1)
+    sq = Y.view(np.float64)
+    np.multiply(sq, sq, out=sq)
+    
+    # Dividir espectro en mitades (mismos bins que la FFT completa)
+    mid = len(y) // 2
+    low_freq_power = np.sum(sq[:2 * (mid//2)])
+    high_freq_power = np.sum(sq[2 * (mid//2):2 * mid])
+    
+    total_power = low_freq_power + high_freq_power
+    
+    if total_power < 1e-10:
+        return 0.0
+    
+    return high_freq_power / total_power
+
+
+def _smoothness(y: np.ndarray, d2y: np.ndarray = None) -> float:
+    """
+    Mide la suavidad de la función
+    
+    Args:
+        y: Valores de la función
+        d2y: Buffer de trabajo de len(y) - 2 elementos (opcional)
+        
+    Returns:
+        Métrica de suavidad (0 = muy irregular, 1 = muy suave)
+    """
+    # Calcular segunda derivada aproximada
+    if len(y) < 3:
+        return 1.0
+    
+    # Variación de la segunda derivada (curvatura)
+    if d2y is None:
+        d2y = np.empty(len(y) - 2)
+    curvature_variation = _smooth_kernel(np.ascontiguousarray(y, dtype=np.float64), d2y)
+    
+    # Normalizar (valores típicos: 0.1-100)
+    # Valores bajos = suave, valores altos = irregular
+    return 1.0 / (1.0 + curvature_variation / 10)
+
+
+def _classify(n_disc: int, high_freq: float, smoothness: float) -> str:
+    """
+    Clasifica la complejidad de la función
+    
+    Args:
+        n_disc: Número de discontinuidades
+        high_freq: Contenido de altas frecuencias
+        smoothness: Métrica de suavidad
+        
+    Returns:
+        'simple', 'medium', 'high', 'extreme'
+    """
+    # Sistema de puntuación: cada métrica suma tantos puntos como
+    # umbrales de su tabla supere
+    
+    # Discontinuidades: 0, 2, 4 o 6 puntos
+    score = 2 * int(np.searchsorted(_DISC_BINS, n_disc))
+    
+    # Contenido de altas frecuencias: 0 a 3 puntos
+    score += int(np.searchsorted(_HF_BINS, high_freq, side='right'))
+    
+    # Suavidad (más suave = menos puntos): 0 a 3 puntos; NaN cuenta como irregular
+    if np.isnan(smoothness):
+        smoothness = 0.0
+    score += 3 - int(np.searchsorted(_SM_BINS, smoothness))
+    
+    # Clasificar según puntuación
+    return _COMPLEXITY_LABELS[int(np.searchsorted(_SCORE_BINS, score))]
+
+
+def _analyze(func: Callable, period: float, num_samples: int = 2048,
+             scratch: Dict = None, with_positions: bool = False) -> Dict:
+    """
+    Analiza la complejidad de func en un período
+    
+    Args:
+        func: Función a analizar
+        period: Período de la función
+        num_samples: Número de puntos (ya redondeado si se quiere potencia de dos)
+        scratch: Buffers de _scratch_buffers(num_samples) a reutilizar (opcional)
+        with_positions: Si True, incluye 'discontinuity_positions' con las
+            posiciones x de las discontinuidades (las recomendaciones solo
+            usan su número)
+        
+    Returns:
+        Diccionario con métricas de complejidad
+    """
+    x, dx = _sampling_grid(period / 2, num_samples)
+    y = _sample(func, x)
+    if y is None:
+        # Función muy problemática
+        return dict(_FAILED_ANALYSIS)
+    
+    if scratch is None:
+        scratch = _scratch_buffers(num_samples)
+    
+    # 1. Detectar discontinuidades
+    disc_indices = _discontinuity_indices(x, y, period, dx, scratch['derivatives'])
+    n_disc = len(disc_indices)
+    
+    # 2. Analizar contenido de altas frecuencias
+    high_freq_content = _frequency_content(y)
+    
+    # 3. Medir suavidad (derivadas)
+    smoothness = _smoothness(y, scratch['d2y'])
+    
+    # 4. Clasificar complejidad
+    complexity = _classify(n_disc, high_freq_content, smoothness)
+    
+    analysis = {
+        'complexity': complexity,
+        'discontinuities': n_disc,
+        'high_frequency_content': high_freq_content,
+        'smoothness': smoothness
+    }
+    if with_positions:
+        analysis['discontinuity_positions'] = x[disc_indices].tolist()
+    return analysis
+
+
+def _recommend_n_terms(analysis: Dict) -> int:
+    """
+    Recomienda número de términos basado en el análisis
+    
+    Args:
+        analysis: Resultado de _analyze
+        
+    Returns:
+        Número recomendado de términos
+    """
+    n_disc = analysis['discontinuities']
+    high_freq = analysis['high_frequency_content']
+    
+    # Base según complejidad
+    recommended = _BASE_TERMS.get(analysis['complexity'], 50)
+    
+    # Ajustar por discontinuidades
+    recommended += n_disc * 15
+    
+    # Ajustar por altas frecuencias
+    if high_freq > 0.5:
+        recommended += 30
+    elif high_freq > 0.3:
+        recommended += 15
+    
+    # Limitar a rangos razonables
+    return max(10, min(300, recommended))
+
+
+def _recommend_speed(n_terms: int) -> str:
+    """
+    Recomienda velocidad de animación según número de términos
+    
+    Args:
+        n_terms: Número de términos a usar
+        
+    Returns:
+        'Lenta', 'Normal', 'Rápida', 'Muy Rápida'
+    """
+    if n_terms < 20:
+        return 'Lenta'
+    elif n_terms < 50:
+        return 'Normal'
+    elif n_terms < 100:
+        return 'Rápida'
+    else:
+        return 'Muy Rápida'
+
+
+def _recommend_window(analysis: Dict) -> str:
+    """
+    Recomienda tipo de ventana según características
+    
+    Args:
+        analysis: Resultado de _analyze
+        
+    Returns:
+        'Rectangular', 'Hann', 'Hamming'
+    """
+    n_disc = analysis['discontinuities']
+    
+    if n_disc == 0:
+        return 'Rectangular'  # Sin discontinuidades, no hace falta ventana
+    elif n_disc <= 2:
+        return 'Hann'  # Pocas discontinuidades, Hann es buena opción
+    else:
+        return 'Hamming'  # Muchas discontinuidades, Hamming reduce mejor Gibbs
+
+
+def _copy_analysis(analysis: Dict) -> Dict:
+    """Copia de un análisis cacheado que el llamador puede modificar libremente"""
+    result = dict(analysis)
+    if 'discontinuity_positions' in result:
+        result['discontinuity_positions'] = list(result['discontinuity_positions'])
+    return result
 
 
 class SmartRecommender:
-    """Recomendador inteligente de parámetros para series de Fourier"""
+    """
+    Recomendador inteligente de parámetros para series de Fourier
+    
+    Fachada sobre las funciones del módulo (_analyze, _recommend_n_terms,
+    ...): guarda la función, el último análisis y los buffers de trabajo.
+    """
     
     def __init__(self, func: Callable, period: float):
         """
@@ -22,184 +551,85 @@ class SmartRecommender:
         self.period = period
         self.L = period / 2
         
-    def analyze_function(self, num_samples: int = 2000) -> Dict:
+        # Último análisis calculado: ((func, period, num_samples), resultado)
+        self._analysis_cache = None
+        
+        # Buffers de trabajo reutilizados entre análisis
+        self._scratch = None
+    
+    def invalidate(self):
+        """Descarta el análisis cacheado (p. ej. si func cambió por dentro)"""
+        self._analysis_cache = None
+        
+    def analyze_function(self, num_samples: int = 2048) -> Dict:
         """
         Analiza la complejidad de la función
         
+        Las métricas son estadísticas y no dependen del número exacto de
+        puntos, así que se redondea a la siguiente potencia de dos (longitud
+        óptima para la FFT).
+        
         Args:
             num_samples: Número de puntos para análisis
             
         Returns:
             Diccionario con métricas de complejidad
         """
-        x = np.linspace(-self.L, self.L, num_samples)
-        
-        try:
-            y = np.array([self.func(xi) for xi in x])
-        except:
-            # Si hay errores, usar evaluación vectorizada
-            try:
-                y = self.func(x)
-            except:
-                # Función muy problemática
-                return {
-                    'complexity': 'extreme',
-                    'discontinuities': -1,
-                    'high_frequency_content': 1.0,
-                    'smoothness': 0.0
-                }
-        
-        # 1. Detectar discontinuidades
-        discontinuities = self._detect_discontinuities(x, y)
-        
-        # 2. Analizar contenido de altas frecuencias
-        high_freq_content = self._analyze_frequency_content(y)
-        
-        # 3. Medir suavidad (derivadas)
-        smoothness = self._measure_smoothness(x, y)
-        
-        # 4. Clasificar complejidad
-        complexity = self._classify_complexity(
-            len(discontinuities), 
-            high_freq_content, 
-            smoothness
-        )
-        
-        return {
-            'complexity': complexity,
-            'discontinuities': len(discontinuities),
-            'high_frequency_content': high_freq_content,
-            'smoothness': smoothness,
-            'discontinuity_positions': discontinuities
-        }
-    
-    def _detect_discontinuities(self, x: np.ndarray, y: np.ndarray) -> list:
-        """Detecta discontinuidades en la función"""
-        discontinuities = []
-        
-        # Calcular diferencias
-        dy = np.diff(y)
-        dx = np.diff(x)
-        
-        # Detectar saltos grandes
-        derivatives = np.abs(dy / (dx + 1e-10))
-        threshold = np.mean(derivatives) + 5 * np.std(derivatives)
-        
-        disc_indices = np.where(derivatives > threshold)[0]
-        
-        for idx in disc_indices:
-            if idx < len(x) - 1:
-                discontinuities.append(x[idx])
-        
-        # Eliminar duplicados muy cercanos
-        if discontinuities:
-            unique_disc = [discontinuities[0]]
-            for d in discontinuities[1:]:
-                if abs(d - unique_disc[-1]) > self.period / 100:
-                    unique_disc.append(d)
-            return unique_disc
-        
-        return []
+        return self._cached_analysis(num_samples, with_positions=False)
     
-    def _analyze_frequency_content(self, y: np.ndarray) -> float:
+    def analyze_with_positions(self, num_samples: int = 2048) -> Dict:
         """
-        Analiza el contenido de altas frecuencias usando FFT
+        Como analyze_function, añadiendo 'discontinuity_positions'
         
+        Args:
+            num_samples: Número de puntos para análisis
+            
         Returns:
-            Proporción de energía en altas frecuencias (0-1)
+            Diccionario con métricas de complejidad y la lista de posiciones
+            x de las discontinuidades
         """
-        # FFT de la señal
-        Y = np.fft.fft(y)
-        power = np.abs(Y)**2
-        
-        # Dividir espectro en mitades
-        mid = len(power) // 2
-        low_freq_power = np.sum(power[:mid//2])
-        high_freq_power = np.sum(power[mid//2:mid])
-        
-        total_power = low_freq_power + high_freq_power
-        
-        if total_power < 1e-10:
-            return 0.0
-        
-        return high_freq_power / total_power
+        return self._cached_analysis(num_samples, with_positions=True)
     
-    def _measure_smoothness(self, x: np.ndarray, y: np.ndarray) -> float:
+    def _cached_analysis(self, num_samples: int, with_positions: bool) -> Dict:
         """
-        Mide la suavidad de la función
+        Análisis con caché del último resultado (ver analyze_function)
         
-        Returns:
-            Métrica de suavidad (0 = muy irregular, 1 = muy suave)
+        La clave incluye func y period, así que reasignarlos invalida la
+        caché sola. Cada llamada recibe su propia copia del resultado.
         """
-        # Calcular segunda derivada aproximada
-        if len(y) < 3:
-            return 1.0
-        
-        d2y = np.diff(np.diff(y))
-        
-        # Variación de la segunda derivada (curvatura)
-        curvature_variation = np.std(d2y)
-        
-        # Normalizar (valores típicos: 0.1-100)
-        # Valores bajos = suave, valores altos = irregular
-        smoothness = 1.0 / (1.0 + curvature_variation / 10)
-        
-        return smoothness
+        num_samples = 1 << (num_samples - 1).bit_length()
+        key = (self.func, self.period, num_samples)
+        
+        cached = self._analysis_cache
+        if (cached is not None and cached[0] == key
+                and (not with_positions or 'discontinuity_positions' in cached[1])):
+            return _copy_analysis(cached[1])
+        
+        if self._scratch is None or self._scratch['n'] != num_samples:
+            self._scratch = _scratch_buffers(num_samples)
+        
+        analysis = _analyze(self.func, self.period, num_samples, self._scratch,
+                            with_positions)
+        if analysis['discontinuities'] >= 0:
+            self._analysis_cache = (key, analysis)
+            return _copy_analysis(analysis)
+        return analysis
+    
+    def _detect_discontinuities(self, x: np.ndarray, y: np.ndarray) -> list:
+        """Detecta discontinuidades en la función"""
+        return _detect_discontinuities(x, y, self.period)
+    
+    def _analyze_frequency_content(self, y: np.ndarray) -> float:
+        """Proporción de energía en altas frecuencias (0-1)"""
+        return _frequency_content(y)
+    
+    def _measure_smoothness(self, x: np.ndarray, y: np.ndarray) -> float:
+        """Métrica de suavidad (0 = muy irregular, 1 = muy suave)"""
+        return _smoothness(y)
     
     def _classify_complexity(self, n_disc: int, high_freq: float, smoothness: float) -> str:
-        """
-        Clasifica la complejidad de la función
-        
-        Args:
-            n_disc: Número de discontinuidades
-            high_freq: Contenido de altas frecuencias
-            smoothness: Métrica de suavidad
-            
-        Returns:
-            'simple', 'medium', 'high', 'extreme'
-        """
-        # Sistema de puntuación
-        score = 0
-        
-        # Discontinuidades
-        if n_disc == 0:
-            score += 0
-        elif n_disc <= 2:
-            score += 2
-        elif n_disc <= 5:
-            score += 4
-        else:
-            score += 6
-        
-        # Contenido de altas frecuencias
-        if high_freq < 0.1:
-            score += 0
-        elif high_freq < 0.3:
-            score += 1
-        elif high_freq < 0.5:
-            score += 2
-        else:
-            score += 3
-        
-        # Suavidad
-        if smoothness > 0.8:
-            score += 0
-        elif smoothness > 0.5:
-            score += 1
-        elif smoothness > 0.3:
-            score += 2
-        else:
-            score += 3
-        
-        # Clasificar según puntuación
-        if score <= 2:
-            return 'simple'
-        elif score <= 5:
-            return 'medium'
-        elif score <= 8:
-            return 'high'
-        else:
-            return 'extreme'
+        """Clasifica la complejidad: 'simple', 'medium', 'high', 'extreme'"""
+        return _classify(n_disc, high_freq, smoothness)
     
     def recommend_n_terms(self, analysis: Dict = None) -> int:
         """
@@ -213,34 +643,7 @@ class SmartRecommender:
         """
         if analysis is None:
             analysis = self.analyze_function()
-        
-        complexity = analysis['complexity']
-        n_disc = analysis['discontinuities']
-        high_freq = analysis['high_frequency_content']
-        
-        # Base según complejidad
-        base_terms = {
-            'simple': 20,
-            'medium': 50,
-            'high': 100,
-            'extreme': 200
-        }
-        
-        recommended = base_terms.get(complexity, 50)
-        
-        # Ajustar por discontinuidades
-        recommended += n_disc * 15
-        
-        # Ajustar por altas frecuencias
-        if high_freq > 0.5:
-            recommended += 30
-        elif high_freq > 0.3:
-            recommended += 15
-        
-        # Limitar a rangos razonables
-        recommended = max(10, min(300, recommended))
-        
-        return recommended
+        return _recommend_n_terms(analysis)
     
     def recommend_speed(self, n_terms: int) -> str:
         """
@@ -250,16 +653,9 @@ class SmartRecommender:
             n_terms: Número de términos a usar
             
         Returns:
-            'Muy Lenta', 'Lenta', 'Normal', 'Rápida'
+            'Lenta', 'Normal', 'Rápida', 'Muy Rápida'
         """
-        if n_terms < 20:
-            return 'Lenta'
-        elif n_terms < 50:
-            return 'Normal'
-        elif n_terms < 100:
-            return 'Rápida'
-        else:
-            return 'Muy Rápida'
+        return _recommend_speed(n_terms)
     
     def recommend_window(self, analysis: Dict = None) -> str:
         """
@@ -273,15 +669,7 @@ class SmartRecommender:
         """
         if analysis is None:
             analysis = self.analyze_function()
-        
-        n_disc = analysis['discontinuities']
-        
-        if n_disc == 0:
-            return 'Rectangular'  # Sin discontinuidades, no hace falta ventana
-        elif n_disc <= 2:
-            return 'Hann'  # Pocas discontinuidades, Hann es buena opción
-        else:
-            return 'Hamming'  # Muchas discontinuidades, Hamming reduce mejor Gibbs
+        return _recommend_window(analysis)
     
     def get_full_recommendation(self) -> Dict:
         """
@@ -293,8 +681,56 @@ class SmartRecommender:
         # Analizar función
         analysis = self.analyze_function()
         
-        # Generar recomendaciones
-        n_terms = self.recommend_n_terms(analysis)
+        return self._build_recommendation(analysis, self.recommend_n_terms(analysis))
+    
+    @classmethod
+    def from_library(cls, lib, key: str) -> Optional[Dict]:
+        """
+        Recomendación para una función de la biblioteca sin muestrearla
+        
+        Usa los metadatos de FunctionLibrary: los términos recomendados, la
+        dificultad (que fija la complejidad) y la descripción y propiedades
+        (que indican si hay saltos). Para funciones escritas por el usuario
+        hay que usar get_full_recommendation.
+        
+        Args:
+            lib: Instancia de FunctionLibrary
+            key: Clave de la función en la biblioteca
+            
+        Returns:
+            Diccionario con el mismo formato que get_full_recommendation,
+            o None si la clave no existe
+        """
+        info = lib.get_function(key)
+        if info is None:
+            return None
+        
+        text = ' '.join([info['description'], *info['properties']]).lower()
+        has_jump = any(marker in text for marker in _JUMP_MARKERS)
+        complexity, high_freq, smoothness = _DIFFICULTY_PROFILES.get(
+            info['difficulty'], _DIFFICULTY_PROFILES['Medio'])
+        
+        analysis = {
+            'complexity': complexity,
+            'discontinuities': int(has_jump),
+            'high_frequency_content': high_freq,
+            'smoothness': smoothness
+        }
+        
+        rec = cls(None, info['period'])
+        return rec._build_recommendation(analysis, info['terms_recommended'])
+    
+    def _build_recommendation(self, analysis: Dict, n_terms: int) -> Dict:
+        """
+        Completa la recomendación (velocidad, ventana y explicación)
+        
+        Args:
+            analysis: Resultado de analyze_function (o equivalente)
+            n_terms: Número de términos recomendado
+            
+        Returns:
+            Diccionario con análisis y recomendaciones
+        """
         speed = self.recommend_speed(n_terms)
         window = self.recommend_window(analysis)
         
@@ -312,75 +748,31 @@ class SmartRecommender:
     def _explain_recommendations(self, analysis: Dict, n_terms: int, 
                                  speed: str, window: str) -> str:
         """Genera explicación de las recomendaciones"""
+        complexity = analysis['complexity']
+        n_disc = analysis['discontinuities']
+        high_freq = analysis['high_frequency_content']
         
-        complexity_names = {
-            'simple': 'SIMPLE',
-            'medium': 'MODERADA',
-            'high': 'ALTA',
-            'extreme': 'MUY ALTA'
-        }
-        
-        explanation = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║           🎯 RECOMENDACIÓN INTELIGENTE DE PARÁMETROS           ║
-╚═══════════════════════════════════════════════════════════════╝
-
-📊 ANÁLISIS DE LA FUNCIÓN:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Complejidad: {complexity_names[analysis['complexity']]}
-Discontinuidades: {analysis['discontinuities']}
-Contenido de altas frecuencias: {analysis['high_frequency_content']:.1%}
-Suavidad: {analysis['smoothness']:.1%}
-
-💡 RECOMENDACIONES:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-✓ Número de términos: {n_terms}
-✓ Velocidad de animación: {speed}
-✓ Tipo de ventana: {window}
-
-📝 JUSTIFICACIÓN:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-        
-        # Explicar términos
-        if analysis['complexity'] == 'simple':
-            explanation += f"• {n_terms} términos son SUFICIENTES para esta función suave\n"
-            explanation += "  Más términos NO mejorarán significativamente la aproximación\n\n"
-        elif analysis['complexity'] == 'medium':
-            explanation += f"• {n_terms} términos logran buen balance precisión/velocidad\n"
-            explanation += "  La función tiene complejidad moderada\n\n"
-        elif analysis['complexity'] == 'high':
-            explanation += f"• {n_terms} términos son NECESARIOS para capturar los detalles\n"
-            explanation += "  La función tiene alta complejidad y/o discontinuidades\n\n"
-        else:
-            explanation += f"• {n_terms} términos son el MÍNIMO para aproximación razonable\n"
-            explanation += "  ⚠️ Función muy compleja, considera simplificarla\n\n"
-        
-        # Explicar ventana
-        if window == 'Rectangular':
-            explanation += "• Ventana RECTANGULAR: sin discontinuidades, no es necesaria\n"
-        elif window == 'Hann':
-            explanation += "• Ventana HANN: reduce el fenómeno de Gibbs suavemente\n"
-        else:
-            explanation += "• Ventana HAMMING: mejor reducción de Gibbs para múltiples discontinuidades\n"
+        parts = [
+            _EXPLANATION_HEADER.format(
+                complexity=_COMPLEXITY_NAMES[complexity], n_disc=n_disc,
+                high_freq=high_freq, smoothness=analysis['smoothness'],
+                n_terms=n_terms, speed=speed, window=window),
+            # Explicar términos y ventana
+            _TERMS_EXPLANATIONS.get(complexity, _TERMS_EXPLANATIONS['extreme']).format(n_terms=n_terms),
+            _WINDOW_EXPLANATIONS.get(window, _WINDOW_EXPLANATIONS['Hamming'])
+        ]
         
         # Advertencias especiales
-        if analysis['discontinuities'] > 0:
-            explanation += f"\n⚠️  FENÓMENO DE GIBBS ESPERADO\n"
-            explanation += f"   {analysis['discontinuities']} discontinuidad(es) causarán sobrepicos del 9%\n"
+        if n_disc > 0:
+            parts.append("\n⚠️  FENÓMENO DE GIBBS ESPERADO\n"
+                         f"   {n_disc} discontinuidad(es) causarán sobrepicos del 9%\n")
         
-        if analysis['high_frequency_content'] > 0.5:
-            explanation += f"\n🔊 ALTO CONTENIDO DE FRECUENCIAS\n"
-            explanation += f"   La función cambia rápidamente, necesita muchos términos\n"
-        
-        explanation += """
-╔═══════════════════════════════════════════════════════════════╗
-║  💡 Sugerencia: Acepta estas recomendaciones para resultados   ║
-║     óptimos, o ajusta manualmente según tus necesidades        ║
-╚═══════════════════════════════════════════════════════════════╝
-"""
+        if high_freq > 0.5:
+            parts.append("\n🔊 ALTO CONTENIDO DE FRECUENCIAS\n"
+                         "   La función cambia rápidamente, necesita muchos términos\n")
         
-        return explanation
+        parts.append(_EXPLANATION_FOOTER)
+        return "".join(parts)
     
     def get_compact_recommendation(self) -> str:
         """Versión compacta para mostrar en GUI"""
@@ -4,17 +4,367 @@ Calcula los coeficientes a₀, aₙ y bₙ de la serie de Fourier
 Optimizado para mejor rendimiento
 """
 
+import ast
 import numpy as np
 import sympy as sp
 from sympy import symbols, sin, cos, pi, integrate, lambdify
-from typing import Dict, List, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable
 from functools import lru_cache
-from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+import os
 import warnings
 
+# Numba es opcional: si está instalado, las funciones condicionales se compilan
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Suprimir warnings de SymPy para mejor rendimiento
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
+# Namespace seguro con funciones matemáticas para expresiones de Python
+_SAFE_NAMESPACE = {
+    'pi': np.pi,
+    'e': np.e,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'exp': np.exp,
+    'log': np.log,
+    'log10': np.log10,
+    'sqrt': np.sqrt,
+    'abs': np.abs,
+    'sign': np.sign,
+    'floor': np.floor,
+    'ceil': np.ceil,
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_fn(expr_str: str) -> Callable:
+    """
+    Convierte una expresión en una función f(x) compilada una sola vez
+    
+    Genera "def _f(x): return <expr>" sobre el namespace seguro y, si Numba
+    está disponible, la compila con njit. Si Numba no puede compilarla se
+    usa la función de Python tal cual. El resultado se cachea por texto.
+
+    Solo la usa la evaluación elemento a elemento de _create_numeric_function
+    (cuando la versión vectorizada falla). No hace falta guardarla en el
+    solver para los epiciclos: cada frame se construye con an_arr/bn_arr y f
+    solo se evalúa una vez por animación, vectorizada, con f_lambda.
+
+    Args:
+        expr_str: Expresión escalar en x (ej: "1 if x > 0 else 0")
+        
+    Returns:
+        Función escalar f(x)
+    """
+    namespace = dict(_SAFE_NAMESPACE, __builtins__={})
+    source = f"def _f(x):\n    return {expr_str}\n"
+    exec(compile(source, '<f(x)>', 'exec'), namespace)
+    fn = namespace['_f']
+    
+    if njit is not None:
+        try:
+            jitted = njit(fn)
+            jitted(0.5)  # Forzar compilación ahora (falla aquí si no es soportada)
+            fn = jitted
+        except Exception:
+            pass
+    
+    return fn
+
+
+@lru_cache(maxsize=1024)
+def _harmonic_integral(f_expr, x, n, L: float, kind: str):
+    """
+    ∫ f(x)·cos(nπx/L) dx (o con sin) en [-L, L], cacheada entre solvers
+    
+    Args:
+        f_expr: Expresión de SymPy de f
+        x: Símbolo de integración
+        n: Armónico (entero o símbolo)
+        L: Semiperíodo
+        kind: 'cos' o 'sin'
+        
+    Returns:
+        Resultado de la integral, o None si SymPy no pudo calcularla
+        (los fallos también se cachean)
+    """
+    trig = cos if kind == 'cos' else sin
+    try:
+        return integrate(f_expr * trig(n * pi * x / L), (x, -L, L))
+    except Exception:
+        return None
+
+
+# La plantilla con n simbólico es cara: un solo hilo la calcula y el resto espera
+_TEMPLATE_LOCK = Lock()
+
+
+def _harmonic_template(f_expr, x, n_symbol, L: float, kind: str):
+    """Integral de _harmonic_integral con n simbólico (calculada una sola vez)"""
+    with _TEMPLATE_LOCK:
+        return _harmonic_integral(f_expr, x, n_symbol, L, kind)
+
+
+def _symbolic_coefficient(f_expr, x, n_symbol, L: float, n_value: int,
+                          kind: str) -> Optional[float]:
+    """
+    aₙ (kind='cos') o bₙ (kind='sin') simbólico para un n concreto
+    
+    Sustituye n en la integral general (una sola integración para todos los
+    armónicos); si el resultado no es un número finito (n resonante, símbolos
+    libres) integra ese n por separado. Ambas integrales quedan cacheadas.
+    
+    Args:
+        f_expr: Expresión de SymPy de f
+        x: Símbolo de integración
+        n_symbol: Símbolo n de la integral general
+        L: Semiperíodo
+        n_value: Armónico
+        kind: 'cos' o 'sin'
+        
+    Returns:
+        Valor del coeficiente, o None si no se pudo calcular simbólicamente
+    """
+    template = _harmonic_template(f_expr, x, n_symbol, L, kind)
+    value = _template_value(template, n_symbol, n_value, L)
+    if value is None:
+        value = _integral_value(_harmonic_integral(f_expr, x, n_value, L, kind), L)
+    return value
+
+
+def _template_value(template, n_symbol, n_value: int, L: float) -> Optional[float]:
+    """Coeficiente de la integral general con n = n_value, o None si no es un número finito"""
+    if template is None:
+        return None
+    try:
+        value = float(template.subs(n_symbol, n_value))
+    except (TypeError, ValueError):
+        return None
+    return value / L if np.isfinite(value) else None
+
+
+def _integral_value(integral, L: float) -> Optional[float]:
+    """Coeficiente de una integral con n concreto, o None si no es numérica"""
+    if integral is None:
+        return None
+    try:
+        return float(integral / L)
+    except (TypeError, ValueError):
+        return None
+
+
+def _integrate_worker(args) -> Optional[float]:
+    """
+    Coeficiente de un n concreto en un proceso aparte (SymPy retiene el GIL)
+    
+    Args:
+        args: Tupla (f_expr, x, L, n_value, kind) (objetos serializables)
+        
+    Returns:
+        Valor del coeficiente, o None si no se pudo calcular simbólicamente
+    """
+    f_expr, x, L, n_value, kind = args
+    return _integral_value(_harmonic_integral(f_expr, x, n_value, L, kind), L)
+
+
+@lru_cache(maxsize=16)
+def _basis(n_points: int, L: float, n_terms: int, x_min: float,
+           x_max: float, dtype: str = 'float64') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bases cos(nπx/L) y sin(nπx/L) sobre linspace(x_min, x_max, n_points)
+    
+    Se cachean (solo lectura) para que las gráficas que evalúan la serie
+    sobre la misma malla no repitan los np.cos/np.sin.
+    
+    Args:
+        n_points: Número de puntos de la malla
+        L: Semiperíodo
+        n_terms: Número de armónicos (filas)
+        x_min, x_max: Extremos de la malla
+        dtype: Nombre del tipo de las bases (los argumentos se calculan en float64)
+        
+    Returns:
+        Tupla (cos_mat, sin_mat) de forma (n_terms, n_points)
+    """
+    x = np.linspace(x_min, x_max, n_points)
+    args = np.outer(np.arange(1, n_terms + 1) * np.pi / L, x)
+    cos_mat = np.cos(args).astype(dtype, copy=False)
+    sin_mat = np.sin(args).astype(dtype, copy=False)
+    cos_mat.flags.writeable = False
+    sin_mat.flags.writeable = False
+    return cos_mat, sin_mat
+
+
+@lru_cache(maxsize=64)
+def _compile_symbolic(x, f_expr) -> Callable:
+    """
+    Convierte una expresión de SymPy en una función f(x) de NumPy compilada
+    
+    Usa lambdify con eliminación de subexpresiones comunes (cse) y, si Numba
+    está disponible, compila la función generada con njit. La compilación se
+    fuerza aquí sobre una malla pequeña y solo se usa si reproduce el
+    resultado de lambdify; si Numba no la soporta (p. ej. Piecewise) se usa
+    la de lambdify. El resultado se cachea por expresión.
+    
+    Args:
+        x: Símbolo de la variable
+        f_expr: Expresión de SymPy
+        
+    Returns:
+        Función f(x) que acepta escalares y arrays
+    """
+    fn = lambdify(x, f_expr, modules=['numpy'], cse=True)
+    
+    if njit is not None:
+        try:
+            # Sin fastmath: f puede dar NaN/inf (sqrt, log) y deben conservarse
+            jitted = njit(fn)
+            probe = np.linspace(-1.0, 1.0, 8)
+            with np.errstate(all='ignore'):
+                expected = np.broadcast_to(np.asarray(fn(probe), dtype=float), probe.shape)
+                got = np.broadcast_to(np.asarray(jitted(probe), dtype=float), probe.shape)
+            if np.allclose(got, expected, equal_nan=True):
+                fn = jitted
+        except Exception:
+            pass
+    
+    return fn
+
+
+# Intervalos de la malla de integración numérica (potencia de dos para la FFT)
+_NUMERIC_INTERVALS = 4096
+
+
+class _ArrayConditionals(ast.NodeTransformer):
+    """
+    Reescribe los condicionales de Python de una expresión en sus
+    equivalentes de NumPy para poder evaluarla sobre un array completo
+    
+    a if c else b -> _where(c, a, b);  c1 and c2 -> _logical_and(c1, c2);
+    c1 or c2 -> _logical_or(c1, c2);  not c -> _logical_not(c);
+    a < x < b -> _logical_and(a < x, x < b)
+    """
+    
+    @staticmethod
+    def _call(name, args):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+    
+    def _chain_and(self, terms):
+        result = terms[0]
+        for term in terms[1:]:
+            result = self._call('_logical_and', [result, term])
+        return result
+    
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return self._call('_where', [node.test, node.body, node.orelse])
+    
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.And):
+            return self._chain_and(node.values)
+        result = node.values[0]
+        for value in node.values[1:]:
+            result = self._call('_logical_or', [result, value])
+        return result
+    
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._call('_logical_not', [node.operand])
+        return node
+    
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # Comparación encadenada: una comparación simple por cada par
+        terms = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            terms.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = right
+        return self._chain_and(terms)
+
+
+# Namespace de las expresiones vectorizadas: el seguro más los equivalentes
+# de NumPy de los condicionales
+_ARRAY_NAMESPACE = dict(
+    _SAFE_NAMESPACE,
+    _where=np.where,
+    _logical_and=np.logical_and,
+    _logical_or=np.logical_or,
+    _logical_not=np.logical_not,
+    __builtins__={},
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_array_fn(expr_str: str) -> Callable:
+    """
+    Convierte una expresión con condicionales en una función f(x) vectorizada
+    
+    La expresión se parsea una sola vez, sus condicionales se reescriben con
+    _ArrayConditionals y se compila; la función resultante evalúa la
+    expresión una única vez sobre todo el array. El resultado se cachea por
+    texto.
+    
+    Args:
+        expr_str: Expresión en x (ej: "1 if x > 0 else 0")
+        
+    Returns:
+        Función f(x) que acepta arrays de NumPy
+    """
+    tree = _ArrayConditionals().visit(ast.parse(expr_str.strip(), mode='eval'))
+    code = compile(ast.fix_missing_locations(tree), '<f(x)>', 'eval')
+    
+    def array_fn(x):
+        # where evalúa ambas ramas: los avisos de la rama descartada no importan
+        with np.errstate(all='ignore'):
+            return eval(code, _ARRAY_NAMESPACE, {'x': x})
+    
+    return array_fn
+
+
+# Series de Fourier conocidas analíticamente. 'an' y 'bn' reciben el array
+# ns = 1..n_terms y el semiperíodo L y devuelven todos los coeficientes de una vez
+_KNOWN_SERIES = {
+    'sin(x)': {
+        'name': 'Función seno',
+        'a0': lambda L: 0,
+        'an': lambda ns, L: np.zeros(len(ns)),
+        'bn': lambda ns, L: (ns == 1).astype(np.float64),
+        'period_factor': 1  # Debe coincidir con período actual
+    },
+    'cos(x)': {
+        'name': 'Función coseno',
+        'a0': lambda L: 0,
+        'an': lambda ns, L: (ns == 1).astype(np.float64),
+        'bn': lambda ns, L: np.zeros(len(ns)),
+        'period_factor': 1
+    },
+    'abs(x)': {
+        'name': 'Valor absoluto',
+        'a0': lambda L: L / 2,  # pi/2 para período 2π
+        'an': lambda ns, L: np.where(ns % 2 == 1, -4*L / (np.pi * ns**2), 0.0),
+        'bn': lambda ns, L: np.zeros(len(ns)),
+        'period_factor': 1
+    },
+    'x**2': {
+        'name': 'Parábola',
+        'a0': lambda L: 2 * L**2 / 3,  # pi²/3 para L=π
+        'an': lambda ns, L: 4 * L**2 * np.where(ns % 2 == 1, -1.0, 1.0) / (np.pi**2 * ns**2),
+        'bn': lambda ns, L: np.zeros(len(ns)),
+        'period_factor': 1
+    }
+}
+
 
 class FourierSolver:
     """Clase para calcular series de Fourier de funciones periódicas"""
@@ -36,6 +386,11 @@ class FourierSolver:
         # Cache para evaluaciones de función
         self._eval_cache = {}
         
+        # Muestras (x, f(x)) y su espectro para las integrales numéricas
+        # (ver _numeric_samples y _numeric_spectrum)
+        self._samples = None
+        self._spectrum = None
+        
         # Símbolos de sympy
         self.x = symbols('x', real=True)
         self.n = symbols('n', integer=True, positive=True)
@@ -56,16 +411,20 @@ class FourierSolver:
             else:
                 # Función normal - parsear con SymPy
                 self.f_symbolic = sp.sympify(processed_str)
-                self.f_lambda = lambdify(self.x, self.f_symbolic, modules=['numpy'])
+                self.f_lambda = _compile_symbolic(self.x, self.f_symbolic)
         except Exception as e:
             raise ValueError(f"Error al parsear la función: {e}")
         
         # Coeficientes
         self.a0 = None
-        self.an_list = []
-        self.bn_list = []
         self.an_symbolic = None
         self.bn_symbolic = None
+        
+        # Coeficientes como arrays de NumPy (an_list/bn_list son los mismos
+        # arrays que an_arr/bn_arr; se rellenan tras calcular)
+        self.an_list = self.an_arr = np.empty(0)
+        self.bn_list = self.bn_arr = np.empty(0)
+        self.mag_arr = np.empty(0)
     
     def _preprocess_function(self, func_str: str) -> Tuple[str, bool]:
         """
@@ -102,34 +461,31 @@ class FourierSolver:
         Returns:
             Función que evalúa la expresión
         """
-        # Namespace seguro con funciones matemáticas
-        safe_namespace = {
-            'pi': np.pi,
-            'e': np.e,
-            'sin': np.sin,
-            'cos': np.cos,
-            'tan': np.tan,
-            'exp': np.exp,
-            'log': np.log,
-            'log10': np.log10,
-            'sqrt': np.sqrt,
-            'abs': np.abs,
-            'sign': np.sign,
-            'floor': np.floor,
-            'ceil': np.ceil,
-        }
+        # Compilar una sola vez (cacheado por texto de la función)
+        fn = _compile_fn(expr_str)
+        try:
+            array_fn = _compile_array_fn(expr_str)
+        except SyntaxError:
+            array_fn = None
         
         def safe_eval_function(x_val):
             """Evalúa la expresión de forma segura"""
             if isinstance(x_val, np.ndarray):
-                # Para arrays, evaluar elemento por elemento
+                # Para arrays, evaluar la expresión vectorizada de una vez
+                if array_fn is not None:
+                    try:
+                        result = np.asarray(array_fn(x_val), dtype=float)
+                        if result.shape != x_val.shape:
+                            result = np.broadcast_to(result, x_val.shape).copy()
+                        return result
+                    except Exception:
+                        pass
+                
+                # Si no se puede vectorizar, evaluar elemento por elemento
                 result = np.zeros_like(x_val, dtype=float)
                 for i, xi in enumerate(x_val):
                     try:
-                        # Evaluar con x = xi
-                        local_ns = {'x': xi}
-                        local_ns.update(safe_namespace)
-                        result[i] = eval(expr_str, {"__builtins__": {}}, local_ns)
+                        result[i] = fn(xi)
                     except Exception as e:
                         print(f"⚠️ Error evaluando en x={xi}: {e}")
                         result[i] = 0
@@ -137,22 +493,102 @@ class FourierSolver:
             else:
                 # Valor escalar
                 try:
-                    local_ns = {'x': x_val}
-                    local_ns.update(safe_namespace)
-                    return float(eval(expr_str, {"__builtins__": {}}, local_ns))
+                    return float(fn(x_val))
                 except Exception as e:
                     print(f"⚠️ Error evaluando en x={x_val}: {e}")
                     return 0.0
         
         return safe_eval_function
+    
+    def _numeric_samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Malla y valores de f para las integrales numéricas
+        
+        Se evalúan una sola vez y se comparten entre a₀ y todos los aₙ, bₙ
+        (ver _numeric_spectrum). [-L, L] se divide en M = _NUMERIC_INTERVALS
+        celdas (o la potencia de dos ≥ 4·n_terms si es mayor, para que la FFT
+        resuelva todos los armónicos) y se muestrea en sus puntos medios: así
+        un salto en x = 0, ±L/2, ±L... nunca cae sobre una muestra, donde su
+        valor en el salto se repartiría como error en todos los armónicos.
+        
+        Returns:
+            Tupla (x_vals, y_vals) de M puntos en (-L, L) (solo lectura)
+        """
+        if self._samples is None:
+            m = max(_NUMERIC_INTERVALS, 1 << (4 * self.n_terms - 1).bit_length())
+            h = 2 * self.L / m
+            x_vals = -self.L + h * (np.arange(m) + 0.5)
+            y_vals = np.broadcast_to(
+                np.asarray(self.f_lambda(x_vals), dtype=np.float64), x_vals.shape).copy()
+            x_vals.flags.writeable = False
+            y_vals.flags.writeable = False
+            self._samples = (x_vals, y_vals)
+        return self._samples
+    
+    def _numeric_spectrum(self) -> np.ndarray:
+        """
+        a₀, aₙ y bₙ numéricos de todos los armónicos que resuelve la malla
+        
+        Con las muestras de _numeric_samples (puntos medios de M celdas
+        iguales) la regla del punto medio para todos los n es una DFT. Una
+        sola np.fft.rfft da todos los coeficientes; empezar en -L + h/2 en
+        lugar de en 0 aporta el factor (-1)ⁿ·e^(-iπn/M). Para integrandos
+        periódicos esta regla converge más rápido que Simpson, así que a₀ y
+        cada aₙ, bₙ sueltos salen de aquí también.
+        
+        Returns:
+            Array complejo c de longitud M/2 + 1 (solo lectura) con
+            a₀ = Re c₀, aₙ = Re cₙ, bₙ = -Im cₙ
+        """
+        if self._spectrum is None:
+            x_vals, y_vals = self._numeric_samples()
+            m = len(x_vals)
+            c = np.fft.rfft(y_vals) * (2.0 / m)
+            
+            # Desfase del origen de la malla: (-1)ⁿ·e^(-iπn/M)
+            n = np.arange(len(c))
+            c *= np.where(n % 2 == 1, -1.0, 1.0) * np.exp(-1j * np.pi * n / m)
+            c.flags.writeable = False
+            self._spectrum = c
+        return self._spectrum
+    
+    def _numeric_coefficient(self, n_value: int, use_cos: bool) -> float:
+        """
+        aₙ (use_cos=True) o bₙ (use_cos=False) por integración numérica
+        
+        Args:
+            n_value: Armónico
+            use_cos: True para aₙ, False para bₙ
+            
+        Returns:
+            Valor del coeficiente
+        """
+        c = self._numeric_spectrum()[n_value]
+        return float(c.real if use_cos else -c.imag)
+    
+    def _numeric_coefficients(self, n_terms: int, cosines: bool = True,
+                              sines: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Todos los aₙ y bₙ (n = 1..n_terms) por integración numérica en bloque
+        
+        Args:
+            n_terms: Número de términos (como mucho self.n_terms)
+            cosines: Calcular los aₙ (si False se devuelven ceros)
+            sines: Calcular los bₙ (si False se devuelven ceros)
+            
+        Returns:
+            Tupla (an, bn) de arrays de longitud n_terms
+        """
+        c = self._numeric_spectrum()[1:n_terms + 1]
+        an = c.real.copy() if cosines else np.zeros(n_terms)
+        bn = -c.imag if sines else np.zeros(n_terms)
+        return an, bn
         
     def calculate_a0(self) -> float:
         """Calcula el coeficiente a₀"""
         # Usar método numérico si no hay forma simbólica disponible
         if self.f_symbolic is None:
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals)
-            self.a0 = np.trapz(y_vals, x_vals) / self.L
+            self.a0 = float(self._numeric_spectrum()[0].real)
             return self.a0
             
         try:
@@ -163,65 +599,91 @@ class FourierSolver:
         except Exception as e:
             print(f"Error calculando a₀ simbólicamente, usando método numérico: {e}")
             # Método numérico de respaldo
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals)
-            self.a0 = np.trapz(y_vals, x_vals) / self.L
+            self.a0 = float(self._numeric_spectrum()[0].real)
             return self.a0
     
     def calculate_an(self, n_value: int) -> float:
         """Calcula el coeficiente aₙ para un n específico"""
         # Usar método numérico si no hay forma simbólica disponible
         if self.f_symbolic is None:
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals) * np.cos(n_value * np.pi * x_vals / self.L)
-            return np.trapz(y_vals, x_vals) / self.L
+            return self._numeric_coefficient(n_value, use_cos=True)
             
-        try:
-            # aₙ = (1/L) ∫f(x)cos(nπx/L)dx de -L a L
-            integrand = self.f_symbolic * cos(n_value * pi * self.x / self.L)
-            integral = integrate(integrand, (self.x, -self.L, self.L))
-            return float(integral / self.L)
-        except Exception as e:
+        # aₙ = (1/L) ∫f(x)cos(nπx/L)dx de -L a L
+        value = _symbolic_coefficient(self.f_symbolic, self.x, self.n, self.L, n_value, 'cos')
+        if value is None:
             print(f"Error calculando a_{n_value} simbólicamente, usando método numérico")
             # Método numérico de respaldo
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals) * np.cos(n_value * np.pi * x_vals / self.L)
-            return np.trapz(y_vals, x_vals) / self.L
+            return self._numeric_coefficient(n_value, use_cos=True)
+        return value
     
     def calculate_bn(self, n_value: int) -> float:
         """Calcula el coeficiente bₙ para un n específico"""
         # Usar método numérico si no hay forma simbólica disponible
         if self.f_symbolic is None:
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals) * np.sin(n_value * np.pi * x_vals / self.L)
-            return np.trapz(y_vals, x_vals) / self.L
+            return self._numeric_coefficient(n_value, use_cos=False)
             
-        try:
-            # bₙ = (1/L) ∫f(x)sin(nπx/L)dx de -L a L
-            integrand = self.f_symbolic * sin(n_value * pi * self.x / self.L)
-            integral = integrate(integrand, (self.x, -self.L, self.L))
-            return float(integral / self.L)
-        except Exception as e:
+        # bₙ = (1/L) ∫f(x)sin(nπx/L)dx de -L a L
+        value = _symbolic_coefficient(self.f_symbolic, self.x, self.n, self.L, n_value, 'sin')
+        if value is None:
             print(f"Error calculando b_{n_value} simbólicamente, usando método numérico")
             # Método numérico de respaldo
-            x_vals = np.linspace(-self.L, self.L, 2000)
-            y_vals = self.f_lambda(x_vals) * np.sin(n_value * np.pi * x_vals / self.L)
-            return np.trapz(y_vals, x_vals) / self.L
+            return self._numeric_coefficient(n_value, use_cos=False)
+        return value
+    
+    def _symbolic_coefficients(self, n_values: List[int], kind: str) -> np.ndarray:
+        """
+        aₙ (kind='cos') o bₙ (kind='sin') simbólicos para varios n
+        
+        Casi todos salen de sustituir n en la integral general (una sola
+        integración, en este hilo). Los n que necesitan su propia integral se
+        reparten entre procesos si son muchos: SymPy retiene el GIL y los
+        hilos no lo paralelizan. Los que SymPy no resuelve se calculan con el
+        método numérico.
+        
+        Args:
+            n_values: Armónicos a calcular
+            kind: 'cos' o 'sin'
+            
+        Returns:
+            Array de coeficientes en el orden de n_values
+        """
+        template = _harmonic_template(self.f_symbolic, self.x, self.n, self.L, kind)
+        values = {n: _template_value(template, self.n, n, self.L) for n in n_values}
+        pending = [n for n in n_values if values[n] is None]
+        
+        if len(pending) > 20:
+            jobs = [(self.f_symbolic, self.x, self.L, n, kind) for n in pending]
+            try:
+                workers = min(len(pending), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    values.update(zip(pending, executor.map(_integrate_worker, jobs)))
+                pending = []
+            except Exception as e:
+                print(f"No se pudieron usar procesos, calculando en serie: {e}")
+        for n in pending:
+            values[n] = _integrate_worker((self.f_symbolic, self.x, self.L, n, kind))
+        
+        use_cos = kind == 'cos'
+        for n in n_values:
+            if values[n] is None:
+                print(f"Error calculando {'a' if use_cos else 'b'}_{n} simbólicamente, usando método numérico")
+                values[n] = self._numeric_coefficient(n, use_cos)
+        return np.fromiter((values[n] for n in n_values), dtype=np.float64,
+                           count=len(n_values))
     
     def calculate_symbolic_coefficients(self):
         """Calcula las fórmulas simbólicas de aₙ y bₙ"""
-        try:
-            # Fórmula simbólica para aₙ
-            integrand_a = self.f_symbolic * cos(self.n * pi * self.x / self.L)
-            self.an_symbolic = integrate(integrand_a, (self.x, -self.L, self.L)) / self.L
-            
-            # Fórmula simbólica para bₙ
-            integrand_b = self.f_symbolic * sin(self.n * pi * self.x / self.L)
-            self.bn_symbolic = integrate(integrand_b, (self.x, -self.L, self.L)) / self.L
-        except Exception as e:
-            print(f"No se pudieron calcular fórmulas simbólicas: {e}")
+        # Las mismas integrales generales (cacheadas) que usan calculate_an/bn
+        integral_a = _harmonic_template(self.f_symbolic, self.x, self.n, self.L, 'cos')
+        integral_b = _harmonic_template(self.f_symbolic, self.x, self.n, self.L, 'sin')
+        
+        if integral_a is None or integral_b is None:
+            print("No se pudieron calcular fórmulas simbólicas")
             self.an_symbolic = None
             self.bn_symbolic = None
+        else:
+            self.an_symbolic = integral_a / self.L
+            self.bn_symbolic = integral_b / self.L
     
     def detect_symmetry(self) -> str:
         """
@@ -234,9 +696,13 @@ class FourierSolver:
             # Muestrear puntos simétricos (evitar x=0 para no dividir por cero)
             test_points = np.linspace(0.1, self.L * 0.95, 25)
             
-            # Evaluar función en puntos simétricos
-            y_positive = self.f_lambda(test_points)
-            y_negative = self.f_lambda(-test_points)
+            # Puntos para simetría de MEDIA ONDA: primera mitad del período
+            test_half = np.linspace(-self.L * 0.5, 0, 15)
+            
+            # Evaluar la función una sola vez en todas las sondas
+            probes = np.concatenate([test_points, -test_points, test_half, test_half + self.L])
+            y = np.broadcast_to(np.asarray(self.f_lambda(probes), dtype=float), probes.shape)
+            y_positive, y_negative, y_half1, y_half2 = np.split(y, [25, 50, 65])
             
             # Test función PAR: f(-x) == f(x)
             is_even = np.allclose(y_negative, y_positive, rtol=1e-4, atol=1e-6)
@@ -245,10 +711,6 @@ class FourierSolver:
             is_odd = np.allclose(y_negative, -y_positive, rtol=1e-4, atol=1e-6)
             
             # Test simetría de MEDIA ONDA: f(x + T/2) == -f(x)
-            # Solo para puntos en primera mitad del período
-            test_half = np.linspace(-self.L * 0.5, 0, 15)
-            y_half1 = self.f_lambda(test_half)
-            y_half2 = self.f_lambda(test_half + self.L)
             is_half_wave = np.allclose(y_half2, -y_half1, rtol=1e-4, atol=1e-6)
             
             if is_even:
@@ -270,58 +732,33 @@ class FourierSolver:
         Returns:
             True si se usó una serie conocida, False si hay que calcular
         """
-        # Base de datos de series conocidas
-        known_series = {
-            'sin(x)': {
-                'name': 'Función seno',
-                'a0': 0,
-                'an': lambda n: 0,
-                'bn': lambda n: 1 if n == 1 else 0,
-                'period_factor': 1  # Debe coincidir con período actual
-            },
-            'cos(x)': {
-                'name': 'Función coseno',
-                'a0': 0,
-                'an': lambda n: 1 if n == 1 else 0,
-                'bn': lambda n: 0,
-                'period_factor': 1
-            },
-            'abs(x)': {
-                'name': 'Valor absoluto',
-                'a0': self.L / 2,  # pi/2 para período 2π
-                'an': lambda n: -4*self.L/(np.pi*n**2) if n % 2 == 1 else 0,
-                'bn': lambda n: 0,
-                'period_factor': 1
-            },
-            'x**2': {
-                'name': 'Parábola',
-                'a0': 2 * self.L**2 / 3,  # pi²/3 para L=π
-                'an': lambda n: 4 * self.L**2 * (-1)**n / (np.pi**2 * n**2),
-                'bn': lambda n: 0,
-                'period_factor': 1
-            }
-        }
-        
         # Normalizar función string
         func_normalized = self.function_str.strip().replace(' ', '')
         
-        if func_normalized in known_series:
-            series = known_series[func_normalized]
+        if func_normalized in _KNOWN_SERIES:
+            series = _KNOWN_SERIES[func_normalized]
             
             print(f"✅ Usando serie conocida: {series['name']}")
             
             # Calcular a0
-            self.a0 = series['a0'] if isinstance(series['a0'], (int, float)) else series['a0']
+            self.a0 = series['a0'](self.L)
             
-            # Calcular coeficientes
-            self.an_list = [series['an'](n) for n in range(1, self.n_terms + 1)]
-            self.bn_list = [series['bn'](n) for n in range(1, self.n_terms + 1)]
+            # Calcular todos los coeficientes de una vez
+            ns = np.arange(1, self.n_terms + 1)
+            self.an_list = series['an'](ns, self.L)
+            self.bn_list = series['bn'](ns, self.L)
             
             print(f"   ⚡ Cálculo instantáneo - {self.n_terms} términos")
             return True
         
         return False
     
+    def _store_coefficient_arrays(self):
+        """Comparte aₙ, bₙ como arrays float64 (sin copiar) y calcula sus magnitudes"""
+        self.an_list = self.an_arr = np.asarray(self.an_list, dtype=np.float64)
+        self.bn_list = self.bn_arr = np.asarray(self.bn_list, dtype=np.float64)
+        self.mag_arr = np.hypot(self.an_arr, self.bn_arr)
+    
     def calculate_all_coefficients(self) -> Dict:
         """Calcula todos los coeficientes hasta n_terms - OPTIMIZADO con simetría"""
         print(f"Calculando {self.n_terms} términos...")
@@ -329,6 +766,7 @@ class FourierSolver:
         # 1. Intentar usar serie conocida (instantáneo)
         if self.use_known_series():
             print(f"✓ Serie conocida detectada - cálculo instantáneo")
+            self._store_coefficient_arrays()
             # Calcular fórmulas simbólicas si aplica
             if self.n_terms <= 50:
                 self.calculate_symbolic_coefficients()
@@ -349,75 +787,44 @@ class FourierSolver:
         print(f"Simetría detectada: {symmetry}")
         
         self.calculate_a0()
-        self.an_list = []
-        self.bn_list = []
         
         # 3. Calcular coeficientes según simetría
-        if symmetry == 'even':
+        if self.f_symbolic is None:
+            # Sin forma simbólica: todos los armónicos de una vez sobre las
+            # mismas muestras (sin bucle por n ni hilos)
+            if symmetry == 'odd':
+                self.a0 = 0.0
+            self.an_list, self.bn_list = self._numeric_coefficients(
+                self.n_terms, cosines=(symmetry != 'odd'), sines=(symmetry != 'even'))
+            
+        elif symmetry == 'even':
             # Función par: solo términos de coseno (bn = 0)
             print("Optimización: función par, solo cosenos")
-            if self.n_terms > 20:
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    an_futures = [executor.submit(self.calculate_an, n) for n in range(1, self.n_terms + 1)]
-                    self.an_list = [future.result() for future in an_futures]
-            else:
-                for n in range(1, self.n_terms + 1):
-                    self.an_list.append(self.calculate_an(n))
-            self.bn_list = [0.0] * self.n_terms
+            self.an_list = self._symbolic_coefficients(range(1, self.n_terms + 1), 'cos')
+            self.bn_list = np.zeros(self.n_terms)
             
         elif symmetry == 'odd':
             # Función impar: solo términos de seno (an = 0, a0 = 0)
             print("Optimización: función impar, solo senos")
             self.a0 = 0.0
-            self.an_list = [0.0] * self.n_terms
-            if self.n_terms > 20:
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    bn_futures = [executor.submit(self.calculate_bn, n) for n in range(1, self.n_terms + 1)]
-                    self.bn_list = [future.result() for future in bn_futures]
-            else:
-                for n in range(1, self.n_terms + 1):
-                    self.bn_list.append(self.calculate_bn(n))
+            self.an_list = np.zeros(self.n_terms)
+            self.bn_list = self._symbolic_coefficients(range(1, self.n_terms + 1), 'sin')
                     
         elif symmetry == 'half_wave':
             # Simetría de media onda: solo armónicos impares
             print("Optimización: simetría de media onda, solo armónicos impares")
-            if self.n_terms > 20:
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    an_futures = {n: executor.submit(self.calculate_an, n) for n in range(1, self.n_terms + 1)}
-                    bn_futures = {n: executor.submit(self.calculate_bn, n) for n in range(1, self.n_terms + 1)}
-                    
-                    for n in range(1, self.n_terms + 1):
-                        if n % 2 == 0:  # Par
-                            self.an_list.append(0.0)
-                            self.bn_list.append(0.0)
-                        else:  # Impar
-                            self.an_list.append(an_futures[n].result())
-                            self.bn_list.append(bn_futures[n].result())
-            else:
-                for n in range(1, self.n_terms + 1):
-                    if n % 2 == 0:  # Par
-                        self.an_list.append(0.0)
-                        self.bn_list.append(0.0)
-                    else:  # Impar
-                        self.an_list.append(self.calculate_an(n))
-                        self.bn_list.append(self.calculate_bn(n))
+            odd_n = range(1, self.n_terms + 1, 2)
+            self.an_list = np.zeros(self.n_terms)
+            self.bn_list = np.zeros(self.n_terms)
+            self.an_list[::2] = self._symbolic_coefficients(odd_n, 'cos')
+            self.bn_list[::2] = self._symbolic_coefficients(odd_n, 'sin')
         else:
             # Sin simetría especial: calcular todo
-            if self.n_terms > 20:
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    an_futures = [executor.submit(self.calculate_an, n) for n in range(1, self.n_terms + 1)]
-                    bn_futures = [executor.submit(self.calculate_bn, n) for n in range(1, self.n_terms + 1)]
-                    
-                    self.an_list = [future.result() for future in an_futures]
-                    self.bn_list = [future.result() for future in bn_futures]
-            else:
-                for n in range(1, self.n_terms + 1):
-                    an = self.calculate_an(n)
-                    bn = self.calculate_bn(n)
-                    self.an_list.append(an)
-                    self.bn_list.append(bn)
+            self.an_list = self._symbolic_coefficients(range(1, self.n_terms + 1), 'cos')
+            self.bn_list = self._symbolic_coefficients(range(1, self.n_terms + 1), 'sin')
         
         print(f"✓ Coeficientes calculados")
+        self._store_coefficient_arrays()
         
         # Calcular fórmulas simbólicas (solo si no hay muchos términos)
         if self.n_terms <= 50:
@@ -434,7 +841,8 @@ class FourierSolver:
             'bn_symbolic': self.bn_symbolic
         }
     
-    def evaluate_series(self, x_values: np.ndarray, n_terms: int = None) -> np.ndarray:
+    def evaluate_series(self, x_values: np.ndarray, n_terms: int = None,
+                        dtype=np.float64) -> np.ndarray:
         """
         Evalúa la serie de Fourier en puntos específicos - OPTIMIZADO
         Usa vectorización completa de NumPy para máximo rendimiento
@@ -442,74 +850,136 @@ class FourierSolver:
         Args:
             x_values: Array de valores de x
             n_terms: Número de términos (si None, usa self.n_terms)
+            dtype: Tipo de la evaluación (np.float32 basta para graficar y
+                mueve la mitad de memoria; los coeficientes no cambian)
         
         Returns:
             Array con los valores de la serie
         """
+        # Atributos en variables locales (se llama en cada redibujado)
+        an_arr, bn_arr, a0, L = self.an_arr, self.bn_arr, self.a0, self.L
+        
         if n_terms is None:
             n_terms = self.n_terms
         
         # Limitar a coeficientes disponibles
-        n_terms = min(n_terms, len(self.an_list))
+        n_terms = min(n_terms, len(an_arr))
         
-        # Iniciar con a₀/2
-        result = np.full_like(x_values, self.a0 / 2, dtype=np.float64)
+        # Las bases cacheadas se buscan con la malla original (antes del cast)
+        basis = self._cached_basis(x_values, n_terms, dtype)
+        x_values = np.asarray(x_values, dtype=dtype)
         
-        # Convertir listas a arrays de NumPy para operaciones vectorizadas
-        an_array = np.array(self.an_list[:n_terms])
-        bn_array = np.array(self.bn_list[:n_terms])
+        # Iniciar con a₀/2 (a₀ se guarda en float64)
+        result = np.full_like(x_values, a0 / 2, dtype=dtype)
         
-        # Crear array de índices n (1, 2, 3, ..., n_terms)
-        n_indices = np.arange(1, n_terms + 1)
+        # Vistas de los arrays de coeficientes (sin copia si dtype es float64)
+        an_array = an_arr[:n_terms].astype(dtype, copy=False)
+        bn_array = bn_arr[:n_terms].astype(dtype, copy=False)
         
-        # Calcular todos los argumentos (broadcasting)
-        # Shape: (n_terms, len(x_values))
-        args = np.outer(n_indices * np.pi / self.L, x_values)
-        
-        # Calcular todas las contribuciones de una vez
-        cos_terms = np.cos(args)  # Shape: (n_terms, len(x_values))
-        sin_terms = np.sin(args)  # Shape: (n_terms, len(x_values))
+        if basis is not None:
+            # Malla uniforme: bases cacheadas (compartidas entre gráficas)
+            cos_terms, sin_terms = basis
+        else:
+            # Crear array de índices n (1, 2, 3, ..., n_terms)
+            n_indices = np.arange(1, n_terms + 1)
+            
+            # Calcular todos los argumentos (broadcasting)
+            # Shape: (n_terms, len(x_values))
+            args = np.outer((n_indices * np.pi / L).astype(dtype), x_values)
+            
+            # Calcular todas las contribuciones de una vez
+            cos_terms = np.cos(args)  # Shape: (n_terms, len(x_values))
+            sin_terms = np.sin(args)  # Shape: (n_terms, len(x_values))
         
-        # Multiplicar por coeficientes y sumar
-        # Broadcasting: (n_terms, 1) * (n_terms, len(x_values))
-        result += np.sum(an_array[:, np.newaxis] * cos_terms, axis=0)
-        result += np.sum(bn_array[:, np.newaxis] * sin_terms, axis=0)
+        # Multiplicar por coeficientes y sumar: producto vector-matriz
+        # (n_terms,) @ (n_terms, len(x_values)), sin temporal intermedio
+        result += an_array @ cos_terms
+        result += bn_array @ sin_terms
         
         return result
     
+    def _cached_basis(self, x_values: np.ndarray, n_terms: int, dtype=np.float64):
+        """
+        Bases cos/sin cacheadas para x_values si es una malla uniforme
+        
+        La caché guarda todos los armónicos disponibles y aquí se toman las
+        primeras n_terms filas; la clave incluye L y el número de
+        coeficientes, así que un cambio de función o de términos no reutiliza
+        bases viejas.
+        
+        Args:
+            x_values: Puntos de evaluación
+            n_terms: Número de términos a usar
+            dtype: Tipo de las bases
+            
+        Returns:
+            Tupla (cos_terms, sin_terms) de forma (n_terms, len(x_values)),
+            o None si x_values no es exactamente un linspace
+        """
+        if not isinstance(x_values, np.ndarray) or x_values.ndim != 1 or len(x_values) < 2:
+            return None
+        
+        x_min, x_max = float(x_values[0]), float(x_values[-1])
+        if not np.array_equal(x_values, np.linspace(x_min, x_max, len(x_values))):
+            return None
+        
+        cos_mat, sin_mat = _basis(len(x_values), float(self.L), len(self.an_arr),
+                                  x_min, x_max, np.dtype(dtype).name)
+        return cos_mat[:n_terms], sin_mat[:n_terms]
+    
     def get_series_expression(self, n_terms: int = None) -> str:
         """Retorna la expresión de la serie como string"""
         if n_terms is None:
             n_terms = self.n_terms
         
-        expr = f"{self.a0/2:.4f}"
+        # Términos no nulos marcados en bloque; el sufijo /L se formatea una vez
+        an_arr = self.an_arr[:max(n_terms, 0)]
+        bn_arr = self.bn_arr[:max(n_terms, 0)]
+        nonzero_a = np.abs(an_arr) > 1e-10
+        nonzero_b = np.abs(bn_arr) > 1e-10
+        suffix = f"πx/{self.L:.2f})"
+        
+        parts = [f"{self.a0/2:.4f}"]
+        for n, an, bn, has_a, has_b in zip(range(1, len(an_arr) + 1), an_arr.tolist(),
+                                           bn_arr.tolist(), nonzero_a, nonzero_b):
+            if has_a:
+                parts.append(f" + {an:.4f}*cos({n}{suffix}")
+            if has_b:
+                parts.append(f" + {bn:.4f}*sin({n}{suffix}")
+        
+        return "".join(parts)
+    
+    def evaluate_with_error(self, x_values: np.ndarray, n_terms: int = None,
+                            dtype=np.float64) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evalúa f(x), la serie y el error en una sola pasada
         
-        for n in range(1, min(n_terms + 1, len(self.an_list) + 1)):
-            an = self.an_list[n-1]
-            bn = self.bn_list[n-1]
+        Args:
+            x_values: Array de valores de x
+            n_terms: Número de términos (si None, usa self.n_terms)
+            dtype: Tipo de la evaluación de la serie (ver evaluate_series)
             
-            if abs(an) > 1e-10:
-                expr += f" + {an:.4f}*cos({n}πx/{self.L:.2f})"
-            if abs(bn) > 1e-10:
-                expr += f" + {bn:.4f}*sin({n}πx/{self.L:.2f})"
-        
-        return expr
+        Returns:
+            Tupla (original, aproximación, error = original - aproximación)
+        """
+        original = np.broadcast_to(
+            np.asarray(self.f_lambda(x_values), dtype=float), np.shape(x_values))
+        approximation = self.evaluate_series(x_values, n_terms, dtype=dtype)
+        return original, approximation, original - approximation
     
     def calculate_error(self, x_values: np.ndarray) -> np.ndarray:
         """Calcula el error entre f(x) y la serie"""
-        original = self.f_lambda(x_values)
-        approximation = self.evaluate_series(x_values)
-        return original - approximation
+        return self.evaluate_with_error(x_values)[2]
     
     def get_coefficients_table(self) -> List[Dict]:
         """Retorna una tabla con todos los coeficientes"""
         table = [{'n': 0, 'an': self.a0, 'bn': 0.0}]
         
-        for n in range(1, len(self.an_list) + 1):
+        for n, (an, bn) in enumerate(zip(self.an_arr.tolist(), self.bn_arr.tolist()), 1):
             table.append({
                 'n': n,
-                'an': self.an_list[n-1],
-                'bn': self.bn_list[n-1]
+                'an': an,
+                'bn': bn
             })
         
         return table
@@ -4,7 +4,8 @@ Módulo visualization.py - Gráficos estáticos de Series de Fourier
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 
 class FourierVisualizer:
@@ -18,33 +19,55 @@ class FourierVisualizer:
             solver: Instancia de FourierSolver
         """
         self.solver = solver
+    
+    def _prepare_figure(self, fig, figsize):
+        """
+        Devuelve una figura lista para dibujar
+        
+        Args:
+            fig: Figura existente a reutilizar (se limpia) o None para crear una
+                nueva fuera de pyplot (no queda registrada ni hay que cerrarla)
+            figsize: Tamaño deseado en pulgadas (ancho, alto)
+            
+        Returns:
+            Figure de matplotlib
+        """
+        if fig is None:
+            fig = Figure(figsize=figsize, layout=None)
+            FigureCanvasAgg(fig)
+        else:
+            fig.clf()
+            fig.set_size_inches(*figsize)
+        
+        fig.patch.set_facecolor('#f8f9fa')
+        return fig
         
-    def create_static_plot(self, show_error=True, n_points=500):
+    def create_static_plot(self, show_error=True, n_points=500, fig=None):
         """
         Crea un gráfico estático comparando f(x) original y la aproximación
         
         Args:
             show_error: Si True, muestra panel de error
             n_points: Número de puntos para graficar
+            fig: Figura a reutilizar (None = crear una nueva)
             
         Returns:
             Figure de matplotlib
         """
         if show_error:
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+            fig = self._prepare_figure(fig, (12, 8))
+            ax1, ax2 = fig.subplots(2, 1)
         else:
-            fig, ax1 = plt.subplots(1, 1, figsize=(12, 6))
-        
-        fig.patch.set_facecolor('#f8f9fa')
+            fig = self._prepare_figure(fig, (12, 6))
+            ax1 = fig.subplots(1, 1)
         
         # Puntos para evaluación
         x_vals = np.linspace(-self.solver.L, self.solver.L, n_points)
         
-        # Evaluar función original
-        y_original = self.solver.f_lambda(x_vals)
-        
-        # Evaluar serie de Fourier
-        y_fourier = self.solver.evaluate_series(x_vals, self.solver.n_terms)
+        # Función original, serie de Fourier y error en una sola evaluación
+        # (serie en float32: de sobra para la resolución de pantalla)
+        y_original, y_fourier, error = self.solver.evaluate_with_error(
+            x_vals, self.solver.n_terms, dtype=np.float32)
         
         # Panel 1: Comparación
         ax1.plot(x_vals, y_original, 'b-', linewidth=2.5, label='f(x) original', alpha=0.7)
@@ -60,7 +83,6 @@ class FourierVisualizer:
         
         if show_error:
             # Panel 2: Error
-            error = y_original - y_fourier
             ax2.plot(x_vals, error, 'g-', linewidth=2, label='Error', alpha=0.7)
             ax2.axhline(0, color='black', linewidth=0.5, alpha=0.3)
             ax2.fill_between(x_vals, 0, error, alpha=0.3, color='green')
@@ -82,24 +104,29 @@ class FourierVisualizer:
                     bbox=dict(boxstyle='round,pad=0.5', facecolor='#fff3cd', 
                              edgecolor='#ffc107', alpha=0.9))
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def create_spectrum_plot(self):
+    def create_spectrum_plot(self, fig=None):
         """
         Crea gráfico del espectro de frecuencias (amplitudes)
         
+        Args:
+            fig: Figura a reutilizar (None = crear una nueva)
+            
         Returns:
             Figure de matplotlib
         """
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-        fig.patch.set_facecolor('#f8f9fa')
+        fig = self._prepare_figure(fig, (12, 8))
+        ax1, ax2 = fig.subplots(2, 1)
+        
+        # Márgenes fijos: evita el cálculo de tight_layout en cada cambio de vista
+        fig.subplots_adjust(left=0.07, right=0.97, bottom=0.07, top=0.94, hspace=0.4)
         
         ns = np.arange(1, self.solver.n_terms + 1)
         
-        # Calcular amplitudes
-        amplitudes = np.sqrt(np.array(self.solver.an_list)**2 + 
-                           np.array(self.solver.bn_list)**2)
+        # Amplitudes ya calculadas por el solver (np.hypot de aₙ, bₙ)
+        amplitudes = self.solver.mag_arr
         
         # Panel 1: Espectro de amplitudes
         ax1.stem(ns, amplitudes, basefmt=' ', linefmt='C0-', markerfmt='C0o')
@@ -111,9 +138,9 @@ class FourierVisualizer:
                      fontsize=13, fontweight='bold', pad=15)
         
         # Panel 2: Coeficientes an y bn
-        ax2.stem(ns, self.solver.an_list, basefmt=' ', linefmt='C0-', 
+        ax2.stem(ns, self.solver.an_arr, basefmt=' ', linefmt='C0-', 
                 markerfmt='C0o', label='an (coseno)')
-        ax2.stem(ns, self.solver.bn_list, basefmt=' ', linefmt='C1-', 
+        ax2.stem(ns, self.solver.bn_arr, basefmt=' ', linefmt='C1-', 
                 markerfmt='C1s', label='bn (seno)')
         ax2.axhline(0, color='black', linewidth=0.5, alpha=0.3)
         ax2.grid(True, alpha=0.3, linestyle='--')
@@ -123,37 +150,47 @@ class FourierVisualizer:
                      fontsize=13, fontweight='bold', pad=15)
         ax2.legend(loc='best', framealpha=0.9, fontsize=10)
         
-        plt.tight_layout()
         return fig
     
-    def create_term_by_term_plot(self, max_terms=6):
+    def create_term_by_term_plot(self, max_terms=6, fig=None):
         """
         Muestra términos individuales de la serie
         
         Args:
             max_terms: Número máximo de términos a mostrar
+            fig: Figura a reutilizar (None = crear una nueva)
             
         Returns:
             Figure de matplotlib
         """
         actual_terms = min(max_terms, self.solver.n_terms)
         
-        fig, axes = plt.subplots(actual_terms, 1, figsize=(12, 2.5 * actual_terms))
-        fig.patch.set_facecolor('#f8f9fa')
+        height = 2.5 * actual_terms
+        fig = self._prepare_figure(fig, (12, height))
+        axes = fig.subplots(actual_terms, 1)
+        
+        # Márgenes fijos en pulgadas (título arriba, etiqueta x abajo)
+        fig.subplots_adjust(left=0.08, right=0.97, bottom=0.5 / height,
+                            top=1 - 0.6 / height, hspace=0.3)
         
         if actual_terms == 1:
             axes = [axes]
         
-        x_vals = np.linspace(-self.solver.L, self.solver.L, 500)
+        x_vals = np.linspace(-self.solver.L, self.solver.L, 500, dtype=np.float32)
+        
+        # Evaluar todos los términos de una vez: una fila por armónico
+        # (en float32, suficiente para dibujar)
+        omegas = (np.arange(1, actual_terms + 1) * np.pi / self.solver.L).astype(np.float32)
+        args = np.outer(omegas, x_vals)
+        an_arr = self.solver.an_arr[:actual_terms, np.newaxis].astype(np.float32)
+        bn_arr = self.solver.bn_arr[:actual_terms, np.newaxis].astype(np.float32)
+        terms = an_arr * np.cos(args) + bn_arr * np.sin(args)
         
         for i, ax in enumerate(axes):
             n = i + 1
             an = self.solver.an_list[i]
             bn = self.solver.bn_list[i]
-            
-            # Evaluar término individual
-            omega = n * np.pi / self.solver.L
-            term = an * np.cos(omega * x_vals) + bn * np.sin(omega * x_vals)
+            term = terms[i]
             
             # Graficar
             ax.plot(x_vals, term, linewidth=2, label=f'n={n}')
@@ -171,7 +208,6 @@ class FourierVisualizer:
         
         axes[-1].set_xlabel('x', fontsize=11, fontweight='bold')
         fig.suptitle('Términos Individuales de la Serie de Fourier', 
-                    fontsize=14, fontweight='bold', y=0.995)
+                    fontsize=14, fontweight='bold', y=1 - 0.15 / height)
         
-        plt.tight_layout()
         return fig
@@ -0,0 +1,23 @@
+"""
+Pruebas del cálculo numérico de coeficientes de modules/solver.py
+"""
+
+import numpy as np
+
+from modules.solver import FourierSolver
+
+
+def test_unit_step_numeric_coefficients():
+    """El escalón unitario da a₀ = 1, aₙ = 0 y bₙ = 2/(nπ) para n impar"""
+    solver = FourierSolver("1 if x > 0 else 0", period=2*np.pi, n_terms=25)
+    solver.calculate_all_coefficients()
+
+    ns = np.arange(1, 26)
+    expected_bn = np.where(ns % 2 == 1, 2 / (np.pi * ns), 0.0)
+
+    assert abs(solver.a0 - 1.0) < 1e-9
+    np.testing.assert_allclose(solver.an_arr, 0.0, atol=1e-9)
+    np.testing.assert_allclose(solver.bn_arr, expected_bn, atol=1e-5)
+
+    # En el salto la serie converge a la media de los límites laterales
+    assert abs(solver.evaluate_series(np.array([0.0]))[0] - 0.5) < 1e-9